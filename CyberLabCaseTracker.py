@@ -12,12 +12,13 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Messagebox
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog, scrolledtext
+from tkinter import Toplevel, Label, Button, Checkbutton, Radiobutton, StringVar, IntVar # Plain tk widgets for report dialogs
 import sqlite3
 import os
 import io
 import time
-from datetime import datetime, date as datetime_date # For isinstance check
-from PIL import Image, ImageTk
+from datetime import datetime, timedelta, date as datetime_date # For isinstance check
+from PIL import Image, ImageTk, UnidentifiedImageError
 import shutil
 import logging
 import hashlib # For password hashing
@@ -25,13 +26,24 @@ import secrets # For generating salt
 import sys # For exiting gracefully
 import threading # For running long tasks in background
 import queue # For inter-thread communication
+from concurrent.futures import ThreadPoolExecutor # For overlapping geocoding requests
 import calendar
+from collections import defaultdict # For map location grouping
+import atexit # For closing the shared database connection
+import weakref # For widget lookup tables that must not keep destroyed widgets alive
 import json
+try:
+    import orjson # Optional: faster JSON for settings values
+except ImportError:
+    orjson = None
 import requests
+import webbrowser
+from xml.sax.saxutils import escape as xml_escape # Cell text becomes Paragraph markup in PDF tables
 
 # --- ReportLab ---
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as ReportLabImage, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, Image as ReportLabImage, PageBreak
+from reportlab.lib.utils import ImageReader
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib import colors
 from reportlab.lib.units import inch
@@ -40,6 +52,8 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT # For text alignment
 # --- Mapping & Geocoding ---
 import tkintermapview
 from geopy.geocoders import Nominatim
+from geopy.adapters import RequestsAdapter
+from geopy.extra.rate_limiter import RateLimiter
 import functools
 from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
 
@@ -54,6 +68,10 @@ import pandas as pd
 # Use ttkbootstrap's DateEntry
 DateEntry = tb.DateEntry
 import openpyxl # For .xlsx export (pandas uses it)
+try:
+    import python_calamine # Optional: native .xlsx reader for imports (pandas 2.2+ 'calamine' engine)
+except ImportError:
+    python_calamine = None
 
 THEME_OPTIONS = [
     ("Light", "flatly"),
@@ -75,6 +93,9 @@ DATA_DIR = os.path.join(SCRIPT_DIR, "app_data")
 LOG_FILENAME = os.path.join(DATA_DIR, "app.log")
 LOGO_FILENAME = os.path.join(DATA_DIR, "logo.png")
 MARKER_ICON_FILENAME = os.path.join(DATA_DIR, "marker_icon.png") # New constant for custom marker icon
+MAP_TILE_CACHE_FILENAME = os.path.join(DATA_DIR, "map_tiles.db") # Offline tile store read by the map widget
+MAP_TILE_USER_AGENT = "CyberLabCaseTracker/6 (+https://github.com/RF-YVY/CyberLabLog)" # Identifies us to tile servers
+MAP_TILE_DOWNLOAD_SLOTS = threading.BoundedSemaphore(2) # Tile servers (OSM's policy) ask for at most 2 connections
 
 DEFAULT_PASSWORD = "admin" # Default password
 
@@ -91,6 +112,36 @@ US_STATE_ABBREVIATIONS = [
     "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC", "PR", "VI", "AS", "GU", "MP", "UM", "US"
 ]
 
+# Device types for the Device Type dropdown
+DEVICE_TYPES = [
+    "", "iOS", "Android", "ChromeOS", "Windows", "SD", "HDD", "SDD", "USB", "SW Return", "Zip file", "drone", "other"
+]
+
+# Entry form comboboxes whose values are remembered (new entries are added to the stored lists)
+EDITABLE_COMBO_FIELDS = frozenset(["examiner", "investigator", "agency", "offense_type", "city_of_offense"])
+
+# Graph types (Graphs tab) -> case column they are grouped by; counted in SQL by count_cases_by_field_db
+GRAPH_COUNT_FIELDS = {
+    "Offense Type": "offense_type",
+    "Device Type": "device_type",
+    "OS": "os",
+    "Agency": "agency",
+    "State of Offense": "state_of_offense",
+    "Examiner": "examiner",
+    "Investigator": "investigator",
+    "Year": "start_date",
+    "City of Offense": "city_of_offense"
+}
+GRAPH_TOTAL_VOLUME = "Total Volume (GB/TB)"
+# Summed in SQL by sum_volume_by_field_db
+GRAPH_VOLUME_FIELDS = {
+    "Total Volume by Examiner": "examiner",
+    "Total Volume by Investigator": "investigator",
+    "Total Volume by Agency": "agency",
+    "Total Volume by Device Type": "device_type"
+}
+GRAPH_TYPES = [*GRAPH_COUNT_FIELDS, GRAPH_TOTAL_VOLUME, *GRAPH_VOLUME_FIELDS]
+
 # Ensure data directory exists
 if not os.path.exists(DATA_DIR):
     os.makedirs(DATA_DIR)
@@ -122,86 +173,205 @@ logging.info(f"Database: {DB_FILENAME}, Data Directory: {DATA_DIR}")
 
 # --- Database Functions ---
 
+# Per-connection PRAGMAs: fewer fsyncs per commit, a larger page cache, and reads served from a
+# memory map of the file (up to 256 MB) instead of read() calls into SQLite's own buffers.
+# journal_mode=WAL is persistent in the database file and is set once in init_db.
+DB_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+_CONN = None # Shared connection, opened on first use by _get_conn()
+_LOCK = threading.RLock() # Serializes access to _CONN (the geocoding thread also uses it)
+
+# case_log read cache; _cases_version is bumped by every write to case_log
+_cases_version = 0
+_cases_cache = None # (version, list of case dicts) from the last get_all_cases_db()
+_cases_by_id = None # (version, {id: case dict}) index over _cases_cache
+_unique_values_cache = {} # (version, field) -> sorted unique values; also (version, START_YEAR_SQL) -> years
+
+def _connect(**kwargs):
+    """Opens a connection to the database with the application's PRAGMAs applied."""
+    conn = sqlite3.connect(os.path.abspath(DB_FILENAME), **kwargs)
+    for pragma in DB_CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def invalidate_cases_cache():
+    """Marks cached case_log results as stale. Call after any write to case_log."""
+    global _cases_version
+    with _LOCK:
+        _cases_version += 1
+        _unique_values_cache.clear()
+
+def _get_conn():
+    """Returns the long-lived shared connection, opening it on first use.
+    Callers must hold _LOCK while using the connection."""
+    global _CONN
+    with _LOCK:
+        if _CONN is None:
+            # Larger statement cache than the default 128: paging and id-list queries vary their SQL
+            # text and would otherwise evict the fixed statements used on every add/edit/lookup
+            _CONN = _connect(check_same_thread=False, cached_statements=512)
+            atexit.register(_CONN.close)
+        return _CONN
+
+# Year of a case's start date; queries must use this exact expression to use idx_start_year
+START_YEAR_SQL = "substr(start_date, 1, 4)"
+
+# All case_log columns; also the columns matched by the free-text search
+CASE_COLUMNS = (
+    "id", "case_number", "examiner", "investigator", "agency", "city_of_offense",
+    "state_of_offense", "start_date", "end_date", "volume_size_gb", "offense_type",
+    "device_type", "model", "os", "data_recovered", "fpr_complete", "notes", "created_at",
+)
+
+# Statements used on every add/edit/delete, built once so SQLite's statement cache reuses them
+_INSERT_CASE_SQL = '''
+    INSERT INTO case_log (
+        case_number, examiner, investigator, agency, city_of_offense, state_of_offense,
+        start_date, end_date, volume_size_gb, offense_type, device_type, model, os,
+        data_recovered, fpr_complete, notes, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_SELECT_CASE_BY_ID_SQL = "SELECT * FROM case_log WHERE id = ?"
+_SELECT_CASE_BY_NUMBER_SQL = "SELECT * FROM case_log WHERE case_number = ?"
+_DELETE_CASE_SQL = "DELETE FROM case_log WHERE id = ?"
+
+# Columns an edit may change; 'id', 'case_number' and 'created_at' are fixed once a case is logged
+_UPDATE_CASE_COLUMNS = tuple(col for col in CASE_COLUMNS if col not in ('id', 'case_number', 'created_at'))
+_UPDATE_CASE_SQL = "UPDATE case_log SET " + ", ".join(f"{col} = ?" for col in _UPDATE_CASE_COLUMNS) + " WHERE id = ?"
+
+_FTS_AVAILABLE = False # Set by _create_case_log_fts when SQLite supports FTS5 trigram indexes
+
+def _create_case_log_fts(cursor):
+    """Creates the case_log_fts full-text index and the triggers that keep it in sync.
+    Uses the trigram tokenizer so MATCH finds substrings, like the LIKE search it replaces.
+    Returns False (and search falls back to LIKE) if this SQLite build lacks FTS5."""
+    global _FTS_AVAILABLE
+    columns = ", ".join(CASE_COLUMNS)
+    new_values = ", ".join(f"new.{col}" for col in CASE_COLUMNS)
+    old_values = ", ".join(f"old.{col}" for col in CASE_COLUMNS)
+    try:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'case_log_fts'")
+        exists = cursor.fetchone() is not None
+        cursor.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS case_log_fts USING fts5(
+                {columns}, content='case_log', content_rowid='id', tokenize='trigram'
+            )
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS case_log_ai AFTER INSERT ON case_log BEGIN
+                INSERT INTO case_log_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS case_log_ad AFTER DELETE ON case_log BEGIN
+                INSERT INTO case_log_fts(case_log_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS case_log_au AFTER UPDATE ON case_log BEGIN
+                INSERT INTO case_log_fts(case_log_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO case_log_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        """)
+        if not exists:
+            # Index the cases that were logged before the FTS table existed
+            cursor.execute("INSERT INTO case_log_fts(case_log_fts) VALUES ('rebuild')")
+        _FTS_AVAILABLE = True
+    except sqlite3.OperationalError as e:
+        logging.warning(f"Full-text search unavailable, using LIKE search instead: {e}")
+        _FTS_AVAILABLE = False
+    return _FTS_AVAILABLE
+
 def init_db():
     """Initializes the SQLite database and creates the case_log table if it doesn't exist."""
-    conn = None # Initialize conn to None
     try:
         db_path = os.path.abspath(DB_FILENAME)
         logging.info(f"[init_db] Using database file: {db_path}")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Create case_log table with an auto-incrementing primary key 'id'
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS case_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                case_number TEXT,
-                examiner TEXT,
-                offense_type TEXT,
-                device_type TEXT,
-                start_date TEXT,
-                end_date TEXT,
-                volume_size_gb REAL,
-                city_of_offense TEXT,
-                state_of_offense TEXT,
-                investigator TEXT,
-                agency TEXT,
-                model TEXT,
-                os TEXT,
-                data_recovered TEXT,
-                fpr_complete INTEGER,
-                notes TEXT,
-                created_at TEXT
-            )
-        ''')
+        with _LOCK:
+            conn = _get_conn()
+            # WAL avoids the rollback-journal fsyncs on every commit; the mode persists in the file
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                cursor = conn.cursor()
+
+                # Create case_log table with an auto-incrementing primary key 'id'
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS case_log (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        case_number TEXT,
+                        examiner TEXT,
+                        offense_type TEXT,
+                        device_type TEXT,
+                        start_date TEXT,
+                        end_date TEXT,
+                        volume_size_gb REAL,
+                        city_of_offense TEXT,
+                        state_of_offense TEXT,
+                        investigator TEXT,
+                        agency TEXT,
+                        model TEXT,
+                        os TEXT,
+                        data_recovered TEXT,
+                        fpr_complete INTEGER,
+                        notes TEXT,
+                        created_at TEXT
+                    )
+                ''')
+
+                # Indexes for duplicate checks by case number and date-range scans
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_case_number ON case_log(case_number)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON case_log(created_at)")
+                # Expression index for the graph year filter and year list (start_date is YYYY-MM-DD)
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_start_year ON case_log({START_YEAR_SQL})")
+                _create_case_log_fts(cursor)
+
+                # Create settings table if it doesn't exist
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS settings (
+                        key TEXT PRIMARY KEY,
+                        value TEXT
+                    )
+                ''')
+
+                # Check if password hash exists, if not, set default
+                cursor.execute("SELECT value FROM settings WHERE key = 'password_hash'")
+                if cursor.fetchone() is None:
+                    salt = generate_salt()
+                    hashed_password = hash_password(DEFAULT_PASSWORD, salt)
+                    cursor.execute("INSERT INTO settings (key, value) VALUES (?, ?)", ('password_hash', hashed_password))
+                    cursor.execute("INSERT INTO settings (key, value) VALUES (?, ?)", ('salt', salt)) # Store salt separately
+                    logging.info("Default password hash and salt set in settings.")
+
+                # Create geocache table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS geocache (
+                        location_key TEXT PRIMARY KEY, -- e.g., "City|State"
+                        latitude REAL NOT NULL,
+                        longitude REAL NOT NULL,
+                        last_accessed TEXT 
+                    )
+                ''')
+                logging.info("Geocache table initialized or already exists.")
 
-        # Create settings table if it doesn't exist
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            )
-        ''')
-
-        # Check if password hash exists, if not, set default
-        cursor.execute("SELECT value FROM settings WHERE key = 'password_hash'")
-        if cursor.fetchone() is None:
-            salt = generate_salt()
-            hashed_password = hash_password(DEFAULT_PASSWORD, salt)
-            cursor.execute("INSERT INTO settings (key, value) VALUES (?, ?)", ('password_hash', hashed_password))
-            cursor.execute("INSERT INTO settings (key, value) VALUES (?, ?)", ('salt', salt)) # Store salt separately
-            logging.info("Default password hash and salt set in settings.")
-
-        # Create geocache table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS geocache (
-                location_key TEXT PRIMARY KEY, -- e.g., "City|State"
-                latitude REAL NOT NULL,
-                longitude REAL NOT NULL,
-                last_accessed TEXT 
-            )
-        ''')
-        logging.info("Geocache table initialized or already exists.")
-
-        conn.commit()
         logging.info("Database initialized successfully.")
 
     except sqlite3.Error as e:
         logging.error(f"Database error during initialization: {e}")
     except Exception as e:
         logging.error(f"An unexpected error occurred during database initialization: {e}")
-    finally:
-        if conn:
-            conn.close()
 
 def get_cached_location_db(location_key):
     """Retrieves cached latitude and longitude for a location_key."""
-    conn = None
     try:
-        conn = sqlite3.connect(DB_FILENAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT latitude, longitude FROM geocache WHERE location_key = ?", (location_key,))
-        row = cursor.fetchone()
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute("SELECT latitude, longitude FROM geocache WHERE location_key = ?", (location_key,))
+            row = cursor.fetchone()
         if row:
             # Optionally, update last_accessed timestamp if you want to manage cache eviction later
             # timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -214,299 +384,695 @@ def get_cached_location_db(location_key):
     except Exception as e:
         logging.error(f"Error retrieving cached location for '{location_key}': {e}")
         return None
-    finally:
-        if conn:
-            conn.close()
 
-def add_cached_location_db(location_key, latitude, longitude):
-    """Adds or updates a location in the geocache."""
-    conn = None
+_geocache_mem = None # location_key -> (latitude, longitude) for the whole geocache, read on first lookup
+
+def _get_geocache_mem():
+    """Returns the in-memory copy of the geocache, reading the table with one query on first use."""
+    global _geocache_mem
+    with _LOCK:
+        if _geocache_mem is None:
+            try:
+                cursor = _get_conn().cursor()
+                cursor.execute("SELECT location_key, latitude, longitude FROM geocache")
+                _geocache_mem = {key: (lat, lon) for key, lat, lon in cursor.fetchall()}
+                logging.debug(f"Loaded {len(_geocache_mem)} geocache entries into memory")
+            except Exception as e:
+                logging.error(f"Error loading geocache: {e}")
+                return {}
+        return _geocache_mem
+
+def get_cached_location(location_key):
+    """Cached (latitude, longitude) for location_key from the in-memory geocache, or None.
+    Kept in step with add_cached_locations_db, so lookups never go back to SQLite."""
+    return _get_geocache_mem().get(location_key)
+
+def invalidate_geocache_mem():
+    """Drops the in-memory geocache; call after changing the geocache table directly."""
+    global _geocache_mem
+    with _LOCK:
+        _geocache_mem = None
+
+def add_cached_locations_db(locations):
+    """Adds or updates several (location_key, latitude, longitude) entries in the geocache
+    in a single transaction."""
     try:
-        conn = sqlite3.connect(DB_FILENAME)
-        cursor = conn.cursor()
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        cursor.execute('''
-            INSERT OR REPLACE INTO geocache (location_key, latitude, longitude, last_accessed)
-            VALUES (?, ?, ?, ?)
-        ''', (location_key, latitude, longitude, timestamp))
-        conn.commit()
-        logging.info(f"Cached/Updated location '{location_key}': {latitude}, {longitude}")
+        with _LOCK:
+            conn = _get_conn()
+            with conn:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO geocache (location_key, latitude, longitude, last_accessed)
+                    VALUES (?, ?, ?, ?)
+                ''', [(key, lat, lon, timestamp) for key, lat, lon in locations])
+            if _geocache_mem is not None:
+                _geocache_mem.update((key, (lat, lon)) for key, lat, lon in locations)
+        logging.info(f"Cached/Updated {len(locations)} location(s) in geocache.")
         return True
     except Exception as e:
-        logging.error(f"Error caching location '{location_key}': {e}")
+        logging.error(f"Error caching {len(locations)} location(s): {e}")
         return False
-    finally:
-        if conn:
-            conn.close()
 
-def add_case_db(case_data):
-    """Adds a new case to the database."""
-    conn = None
-    try:
-        db_path = os.path.abspath(DB_FILENAME)
-        logging.info(f"[add_case_db] Using database file: {db_path}")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+def add_cached_location_db(location_key, latitude, longitude):
+    """Adds or updates a location in the geocache."""
+    if add_cached_locations_db([(location_key, latitude, longitude)]):
+        logging.info(f"Cached/Updated location '{location_key}': {latitude}, {longitude}")
+        return True
+    return False
 
-        # Convert boolean for fpr_complete to integer 0 or 1
-        fpr_int = 1 if case_data.get("fpr_complete") else 0
-        # Convert boolean for data_recovered to string "Yes" or "No" or ""
-        dr_val = case_data.get("data_recovered")
-        dr_str = "Yes" if dr_val is True else ("No" if dr_val is False else "")
+def data_recovered_to_db(value):
+    """Converts a data_recovered value to the stored "Yes", "No" or "" string.
+    Accepts booleans from the form as well as already-converted Yes/No strings."""
+    if value is True:
+        return "Yes"
+    if value is False:
+        return "No"
+    return value if value in ("Yes", "No") else ""
+
+def _case_insert_row(case_data, created_at):
+    """Builds the INSERT parameter tuple for one case, in case_log column order."""
+    case_number = case_data.get("case_number")
+    return (
+        str(case_number).strip() if case_number is not None else None,
+        case_data.get("examiner"),
+        case_data.get("investigator"),
+        case_data.get("agency"),
+        case_data.get("city_of_offense"),
+        case_data.get("state_of_offense"),
+        case_data.get("start_date"),
+        case_data.get("end_date"),
+        case_data.get("volume_size_gb"),
+        case_data.get("offense_type"),
+        case_data.get("device_type"),
+        case_data.get("model"),
+        case_data.get("os"),
+        data_recovered_to_db(case_data.get("data_recovered")), # Yes/No/"" string
+        1 if case_data.get("fpr_complete") else 0, # Boolean to integer 0 or 1
+        case_data.get("notes"),
+        created_at
+    )
 
-        # Get current timestamp for created_at
+def add_cases_db(cases):
+    """Adds several cases (any iterable of case dicts) to the database in a single transaction.
+    Returns the number of cases inserted (0 if the batch failed and was rolled back)."""
+    try:
+        # One created_at timestamp for the whole batch
         created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # Rows are fed to executemany as they are built, so large imports never hold a second full copy
+        rows = (_case_insert_row(case_data, created_at) for case_data in cases)
+
+        with _LOCK:
+            conn = _get_conn()
+            with conn: # Commits on success, rolls back on error
+                inserted = conn.executemany(_INSERT_CASE_SQL, rows).rowcount
+            invalidate_cases_cache()
+        logging.info(f"{inserted} case(s) added to database.")
+        return inserted
+    except Exception as e:
+        logging.error(f"Error adding cases to database, batch rolled back: {e}")
+        return 0
 
-        cursor.execute('''
-            INSERT INTO case_log (
-                case_number, examiner, investigator, agency, city_of_offense, state_of_offense,
-                start_date, end_date, volume_size_gb, offense_type, device_type, model, os,
-                data_recovered, fpr_complete, notes, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            str(case_data.get("case_number")).strip() if case_data.get("case_number") is not None else None,
-            case_data.get("examiner"),
-            case_data.get("investigator"),
-            case_data.get("agency"),
-            case_data.get("city_of_offense"),
-            case_data.get("state_of_offense"),
-            case_data.get("start_date"),
-            case_data.get("end_date"),
-            case_data.get("volume_size_gb"),
-            case_data.get("offense_type"),
-            case_data.get("device_type"),
-            case_data.get("model"),
-            case_data.get("os"),
-            dr_str,
-            fpr_int,
-            case_data.get("notes"),
-            created_at
-        ))
-        conn.commit()
+def add_case_db(case_data):
+    """Adds a new case to the database."""
+    if add_cases_db([case_data]):
         logging.info(f"Case '{case_data.get('case_number', '')}' added to database.")
         return True
-    except Exception as e:
-        logging.error(f"Error adding case '{case_data.get('case_number', 'N/A')}' to database: {e}")
-        return False
-    finally:
-        if conn:
-            conn.close()
+    logging.error(f"Error adding case '{case_data.get('case_number', 'N/A')}' to database.")
+    return False
+
+def _fetch_dicts(cursor):
+    """Fetches the remaining rows of an executed cursor as dicts keyed by column name.
+    Rows are plain tuples (the connection has no row factory), so nothing is built per row but the dict."""
+    names = [d[0] for d in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
 
 def get_all_cases_db():
-    """Retrieves all cases from the database."""
-    conn = None
+    """Retrieves all cases from the database.
+    Results are cached until the next write; treat the returned dicts as read-only."""
+    global _cases_cache
     try:
-        db_path = os.path.abspath(DB_FILENAME)
-        logging.info(f"[get_all_cases_db] Using database file: {db_path}")
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row  # To access columns by name
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM case_log")
-        rows = cursor.fetchall()
-        # Convert rows to list of dictionaries
-        return [dict(row) for row in rows]
+        with _LOCK:
+            if _cases_cache is None or _cases_cache[0] != _cases_version:
+                cursor = _get_conn().cursor()
+                cursor.execute("SELECT * FROM case_log")
+                # Convert rows to list of dictionaries
+                _cases_cache = (_cases_version, _fetch_dicts(cursor))
+            return list(_cases_cache[1])
     except Exception as e:
         logging.error(f"Error retrieving all cases from database: {e}")
         return []
-    finally:
-        if conn:
-            conn.close()
 
 def get_case_by_number_db(case_number):
     """Retrieves a single case by its case number."""
-    conn = None
     try:
-        conn = sqlite3.connect(DB_FILENAME)
-        conn.row_factory = sqlite3.Row  # To access columns by name
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM case_log WHERE case_number = ?", (str(case_number).strip(),)) # Ensure search is stripped
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(_SELECT_CASE_BY_NUMBER_SQL, (str(case_number).strip(),)) # Ensure search is stripped
+            rows = _fetch_dicts(cursor)
+        return rows[0] if rows else None
     except Exception as e:
         logging.error(f"Error retrieving case by number '{case_number}': {e}")
         return None
-    finally:
-        if conn:
-            conn.close()
 
 def get_case_by_id_db(case_id):
-    """Retrieves a single case by its database ID."""
-    conn = None
+    """Retrieves a single case by its database ID.
+    Served from the get_all_cases_db() cache when it is current."""
+    global _cases_by_id
     try:
-        conn = sqlite3.connect(DB_FILENAME)
-        conn.row_factory = sqlite3.Row  # To access columns by name
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM case_log WHERE id = ?", (case_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        with _LOCK:
+            if _cases_cache is not None and _cases_cache[0] == _cases_version:
+                if _cases_by_id is None or _cases_by_id[0] != _cases_version:
+                    _cases_by_id = (_cases_version, {case['id']: case for case in _cases_cache[1]})
+                case = _cases_by_id[1].get(case_id)
+                if case is not None:
+                    return dict(case) # Copy so callers can't mutate the cache
+            cursor = _get_conn().cursor()
+            cursor.execute(_SELECT_CASE_BY_ID_SQL, (case_id,))
+            rows = _fetch_dicts(cursor)
+        return rows[0] if rows else None
     except Exception as e:
         logging.error(f"Error retrieving case by ID '{case_id}': {e}")
         return None
-    finally:
-        if conn:
-            conn.close()
 
 
-def update_case_db(case_id, case_data):
-    """Updates an existing case record in the database."""
-    conn = None
+def get_cases_by_ids_db(case_ids):
+    """Retrieves the cases with the given database IDs, in id order."""
+    case_ids = list(case_ids)
+    cases = []
     try:
-        conn = sqlite3.connect(DB_FILENAME)
-        cursor = conn.cursor()
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            # Chunk the IN list to stay under SQLite's bound-parameter limit
+            for start in range(0, len(case_ids), 500):
+                chunk = case_ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"SELECT * FROM case_log WHERE id IN ({placeholders}) ORDER BY id", chunk)
+                cases.extend(_fetch_dicts(cursor))
+        if len(case_ids) > 500:
+            cases.sort(key=lambda case: case['id'])
+        return cases
+    except Exception as e:
+        logging.error(f"Error retrieving {len(case_ids)} case(s) by ID: {e}")
+        return []
 
-        # Construct the SET part of the SQL query dynamically
-        # Exclude 'id', 'case_number' (shouldn't be updated directly via edit form submit), and 'created_at'
-        fields_to_update = [field for field in case_data.keys() if field not in ['id', 'case_number', 'created_at']]
-        set_clause = ', '.join([f'{field} = ?' for field in fields_to_update])
+def get_offenses_by_location_db():
+    """Returns {(city, state): sorted offense types} for every case location with both a city and a state.
+    Locations whose cases have no offense type map to an empty list."""
+    try:
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(
+                "SELECT DISTINCT trim(city_of_offense), trim(state_of_offense), trim(COALESCE(offense_type, '')) "
+                "FROM case_log WHERE trim(COALESCE(city_of_offense, '')) != '' AND trim(COALESCE(state_of_offense, '')) != ''")
+            rows = cursor.fetchall()
+        offenses = defaultdict(set)
+        for city, state, offense in rows:
+            location = offenses[(city, state)]
+            if offense:
+                location.add(offense)
+        return {location: sorted(values) for location, values in offenses.items()}
+    except Exception as e:
+        logging.error(f"Error retrieving case locations from database: {e}")
+        return {}
+
+def get_last_nonempty_field_db(field):
+    """Returns field's value from the newest case where it is not blank, or None.
+    Walks the primary key backwards, so it usually stops after reading a row or two."""
+    if field not in CASE_COLUMNS:
+        logging.error(f"Refusing to read unknown case column '{field}'.")
+        return None
+    try:
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(f"SELECT {field} FROM case_log WHERE trim(COALESCE({field}, '')) != '' ORDER BY id DESC LIMIT 1")
+            row = cursor.fetchone()
+        return row[0] if row else None
+    except Exception as e:
+        logging.error(f"Error retrieving last '{field}' value: {e}")
+        return None
 
-        if not set_clause:
-            logging.warning(f"No valid fields to update for case ID {case_id}.")
-            return False # Nothing to update
+# Volume rows that aggregate; text that didn't convert on insert is skipped, as float() would
+_NUMERIC_VOLUME_SQL = "typeof(volume_size_gb) IN ('integer', 'real')"
+
+def _year_clause(year):
+    """Builds the WHERE expression and parameters matching cases started in year ("All"/None for any)."""
+    if not year or year == "All":
+        return "1", ()
+    return f"{START_YEAR_SQL} = ?", (year,)
 
-        # Convert boolean for fpr_complete to integer 0 or 1 for database
-        if 'fpr_complete' in fields_to_update:
-             case_data['fpr_complete'] = 1 if case_data.get('fpr_complete') else 0
+def get_start_years_db():
+    """Returns the distinct start-date years (YYYY strings), newest first.
+    Cached with the unique field values until the next write to case_log."""
+    try:
+        with _LOCK:
+            key = (_cases_version, START_YEAR_SQL)
+            if key not in _unique_values_cache:
+                cursor = _get_conn().cursor()
+                cursor.execute(
+                    f"SELECT DISTINCT {START_YEAR_SQL} AS year FROM case_log "
+                    "WHERE year GLOB '[0-9][0-9][0-9][0-9]' ORDER BY year DESC")
+                _unique_values_cache[key] = [row[0] for row in cursor.fetchall()]
+            return list(_unique_values_cache[key])
+    except Exception as e:
+        logging.error(f"Error retrieving case start years: {e}")
+        return []
 
-        # Convert boolean for data_recovered to string "Yes" or "No" or ""
-        if 'data_recovered' in fields_to_update:
-             dr_val = case_data.get('data_recovered')
-             case_data['data_recovered'] = "Yes" if dr_val is True else ("No" if dr_val is False else "") # Convert bool to Yes/No string
+def count_cases_by_field_db(field, year=None):
+    """Returns [(value, case count), ...] for field, largest first, with blanks as 'Unknown'.
+    field 'start_date' is grouped by its year."""
+    if field not in CASE_COLUMNS:
+        logging.error(f"Refusing to group by unknown case column '{field}'.")
+        return []
+    group = START_YEAR_SQL if field == "start_date" else field
+    where, params = _year_clause(year)
+    try:
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(
+                f"SELECT COALESCE(NULLIF({group}, ''), 'Unknown') AS grp, COUNT(*) FROM case_log "
+                f"WHERE {where} GROUP BY grp ORDER BY 2 DESC, grp", params)
+            return cursor.fetchall()
+    except Exception as e:
+        logging.error(f"Error counting cases by '{field}': {e}")
+        return []
 
+def sum_volume_by_field_db(field, year=None):
+    """Returns [(value, total GB), ...] for field, largest first, with blanks as 'Unknown'."""
+    if field not in CASE_COLUMNS:
+        logging.error(f"Refusing to group by unknown case column '{field}'.")
+        return []
+    where, params = _year_clause(year)
+    try:
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(
+                f"SELECT COALESCE(NULLIF(trim({field}), ''), 'Unknown') AS grp, SUM(volume_size_gb) FROM case_log "
+                f"WHERE {where} AND {_NUMERIC_VOLUME_SQL} GROUP BY grp ORDER BY 2 DESC, grp", params)
+            return cursor.fetchall()
+    except Exception as e:
+        logging.error(f"Error summing volume by '{field}': {e}")
+        return []
 
-        # Prepare the values tuple, ensuring the order matches the set_clause
-        values = tuple(case_data[field] for field in fields_to_update) + (case_id,)
+def total_volume_db(year=None):
+    """Returns the total volume in GB across cases (optionally only those started in year)."""
+    where, params = _year_clause(year)
+    try:
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(f"SELECT TOTAL(volume_size_gb) FROM case_log WHERE {where} AND {_NUMERIC_VOLUME_SQL}", params)
+            return cursor.fetchone()[0]
+    except Exception as e:
+        logging.error(f"Error totalling case volume: {e}")
+        return 0.0
+
+
+# All columns joined into one string per row, so a search is a single LIKE instead of one
+# per column; char(31) (unit separator) keeps matches from spanning two columns
+CASE_SEARCH_HAYSTACK = "(" + " || char(31) || ".join(f"COALESCE({col}, '')" for col in CASE_COLUMNS) + ")"
+
+def _case_search_clause(query):
+    """Builds the WHERE expression and parameters matching query in any column.
+    Returns ("1", ()) for an empty query so it can always be embedded."""
+    query = (query or "").strip()
+    if not query:
+        return "1", ()
+    if _FTS_AVAILABLE and len(query) >= 3:
+        # Trigram index lookup; the query is quoted so it is matched as one literal phrase
+        phrase = '"' + query.replace('"', '""') + '"'
+        return "id IN (SELECT rowid FROM case_log_fts WHERE case_log_fts MATCH ?)", (phrase,)
+    # Shorter queries can't use trigrams; escape LIKE wildcards so the query is matched literally
+    pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    return f"{CASE_SEARCH_HAYSTACK} LIKE ? ESCAPE '\\'", (pattern,)
+
+def search_cases_db(query):
+    """Retrieves cases where any column contains the query text (case-insensitive)."""
+    if not (query or "").strip():
+        return get_all_cases_db()
+    try:
+        where, params = _case_search_clause(query)
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(f"SELECT * FROM case_log WHERE {where}", params)
+            return _fetch_dicts(cursor)
+    except Exception as e:
+        logging.error(f"Error searching cases for '{query}': {e}")
+        return []
 
-        cursor.execute(f'''
-            UPDATE case_log
-            SET {set_clause}
-            WHERE id = ?
-        ''', values)
-        conn.commit()
+def count_cases_db(query=""):
+    """Returns the number of cases matching the search query (all cases if empty)."""
+    try:
+        where, params = _case_search_clause(query)
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM case_log WHERE {where}", params)
+            return cursor.fetchone()[0]
+    except Exception as e:
+        logging.error(f"Error counting cases for '{query}': {e}")
+        return 0
+
+def _display_column_sql(col):
+    """SQL expression for col formatted as the View Data tab shows it: dates as MM-DD-YYYY
+    (format_date_str_for_display), FPR as Yes/No (format_bool_int), NULL as ""."""
+    if col == "id":
+        return col # Kept as the integer key for paging and lookups
+    if col in ("start_date", "end_date", "created_at"):
+        return (f"CASE WHEN {col} GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*' "
+                f"THEN substr({col}, 6, 2) || '-' || substr({col}, 9, 2) || '-' || substr({col}, 1, 4) "
+                f"ELSE COALESCE({col}, '') END")
+    if col == "fpr_complete":
+        return f"CASE {col} WHEN 1 THEN 'Yes' WHEN 0 THEN 'No' ELSE '' END"
+    return f"COALESCE({col}, '')"
+
+def _display_select(columns):
+    """SELECT list for row tuples laid out like columns; a None (or unknown) entry yields ""."""
+    return ", ".join(_display_column_sql(col) if col in CASE_COLUMNS else "''" for col in columns)
+
+def get_cases_page_db(columns, query="", after_id=None, limit=200, before_id=None):
+    """Retrieves up to limit cases matching query, in id order, with id greater than after_id
+    (or, with before_id, the limit cases immediately preceding that id).
+    Rows are plain tuples of display values (see _display_column_sql) in the order of columns;
+    a None entry in columns yields "" so callers can keep a fixed row layout while only reading
+    the columns they show. Keyset paging on the primary key keeps every page as cheap as the first."""
+    select = _display_select(columns)
+    where, params = _case_search_clause(query)
+    order = "id"
+    if after_id is not None:
+        where += " AND id > ?"
+        params += (after_id,)
+    if before_id is not None:
+        where += " AND id < ?"
+        params += (before_id,)
+        order = "id DESC" # Nearest rows first; reversed below
+    try:
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(f"SELECT {select} FROM case_log WHERE {where} ORDER BY {order} LIMIT ?", params + (limit,))
+            rows = cursor.fetchall()
+        if before_id is not None:
+            rows.reverse()
+        return rows
+    except Exception as e:
+        logging.error(f"Error retrieving page of cases after ID {after_id} / before ID {before_id}: {e}")
+        return []
+
+def get_sorted_case_ids_db(column, query=""):
+    """Returns the ids of the cases matching query, ordered by column (text case-insensitively),
+    ties broken by id. Reverse the list for a descending sort."""
+    if column not in CASE_COLUMNS:
+        logging.error(f"Refusing to sort by unknown case column '{column}'.")
+        return []
+    where, params = _case_search_clause(query)
+    try:
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(f"SELECT id FROM case_log WHERE {where} ORDER BY {column} COLLATE NOCASE, id", params)
+            return [row[0] for row in cursor.fetchall()]
+    except Exception as e:
+        logging.error(f"Error sorting cases by '{column}': {e}")
+        return []
+
+def get_case_rows_by_ids_db(columns, case_ids):
+    """Retrieves cases as row tuples laid out like get_cases_page_db(), in the order of case_ids.
+    columns must include 'id'."""
+    case_ids = list(case_ids)
+    select = _display_select(columns)
+    id_index = columns.index('id')
+    rows_by_id = {}
+    try:
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            # Chunk the IN list to stay under SQLite's bound-parameter limit
+            for start in range(0, len(case_ids), 500):
+                chunk = case_ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"SELECT {select} FROM case_log WHERE id IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    rows_by_id[row[id_index]] = row
+        # Cases deleted since the ids were read are skipped
+        return [rows_by_id[case_id] for case_id in case_ids if case_id in rows_by_id]
+    except Exception as e:
+        logging.error(f"Error retrieving {len(case_ids)} case row(s) by ID: {e}")
+        return []
+
+def get_cases_in_date_range_db(start_date=None, end_date=None, recent_cutoff=None):
+    """Retrieves cases created between start_date and end_date (inclusive).
+    Dates are 'YYYY-MM-DD' strings; either bound may be None for an open range.
+    recent_cutoff ('YYYY-MM-DD HH:MM:SS') additionally keeps only cases created at or after it."""
+    conditions = ["created_at IS NOT NULL"]
+    params = []
+    # Lower bounds all compare the same indexed column, so one range scan serves both
+    for lower in (start_date, recent_cutoff):
+        if lower:
+            conditions.append("created_at >= ?")
+            params.append(lower)
+    if end_date:
+        # created_at carries a time, so compare against the start of the following day
+        next_day = (datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        conditions.append("created_at < ?")
+        params.append(next_day)
+    try:
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute(f"SELECT * FROM case_log WHERE {' AND '.join(conditions)}", params)
+            return _fetch_dicts(cursor)
+    except Exception as e:
+        logging.error(f"Error retrieving cases between '{start_date}' and '{end_date}': {e}")
+        return []
+
+
+def update_case_db(case_id, case_data):
+    """Updates an existing case record in the database.
+    Fields missing from case_data keep their stored values; every column is written with one
+    fixed UPDATE statement."""
+    try:
+        if not any(field in case_data for field in _UPDATE_CASE_COLUMNS):
+            logging.warning(f"No valid fields to update for case ID {case_id}.")
+            return False # Nothing to update
+
+        with _LOCK:
+            existing = get_case_by_id_db(case_id)
+            if existing is None:
+                logging.error(f"Failed to update case ID {case_id} in DB: case not found.")
+                return False
+            merged = {**existing, **{field: case_data[field] for field in _UPDATE_CASE_COLUMNS if field in case_data}}
+            # Convert boolean for fpr_complete to integer 0 or 1 for database
+            merged['fpr_complete'] = 1 if merged.get('fpr_complete') else 0
+            # Convert boolean for data_recovered to string "Yes" or "No" or ""
+            merged['data_recovered'] = data_recovered_to_db(merged.get('data_recovered'))
+            values = tuple(merged[field] for field in _UPDATE_CASE_COLUMNS) + (case_id,)
+
+            conn = _get_conn()
+            with conn:
+                conn.execute(_UPDATE_CASE_SQL, values)
+            invalidate_cases_cache()
         logging.info(f"Case ID {case_id} updated successfully in DB.")
         return True
     except Exception as e:
         logging.error(f"Failed to update case ID {case_id} in DB: {e}")
         # show_error ("DB Error", f"Update case failed for ID {case_id}: {e}"); # Avoid messagebox in helper
         return False
-    finally:
-        if conn:
-            conn.close()
 
 
-def delete_case_db(case_id):
-    """Deletes a case record from the database by its ID."""
-    conn = None
+def update_case_fields_db(case_id, fields):
+    """Writes only the given columns of a case, e.g. the cells an undo/redo restores.
+    Column names are checked against the updatable case columns before building the statement."""
+    fields = {field: value for field, value in fields.items() if field in _UPDATE_CASE_COLUMNS}
+    if not fields:
+        logging.warning(f"No valid fields to update for case ID {case_id}.")
+        return False
+    if 'fpr_complete' in fields:
+        fields['fpr_complete'] = 1 if fields['fpr_complete'] else 0
+    if 'data_recovered' in fields:
+        fields['data_recovered'] = data_recovered_to_db(fields['data_recovered'])
+    sql = "UPDATE case_log SET " + ", ".join(f"{field} = ?" for field in fields) + " WHERE id = ?"
     try:
-        conn = sqlite3.connect(DB_FILENAME)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM case_log WHERE id = ?", (case_id,))
-        conn.commit()
-        logging.info(f"Case ID {case_id} deleted successfully from DB.")
+        with _LOCK:
+            conn = _get_conn()
+            with conn:
+                conn.execute(sql, tuple(fields.values()) + (case_id,))
+            invalidate_cases_cache()
+        logging.info(f"Case ID {case_id} fields {', '.join(fields)} updated in DB.")
         return True
     except Exception as e:
-        logging.error(f"Failed to delete case ID {case_id} from DB: {e}")
-        # show_error ("DB Error", f"Delete case failed for ID {case_id}: {e}"); # Avoid messagebox in helper
+        logging.error(f"Failed to update fields of case ID {case_id} in DB: {e}")
         return False
-    finally:
-        if conn:
-            conn.close()
+
+
+def delete_cases_db(case_ids):
+    """Deletes several case records by ID in a single transaction.
+    Returns the number of cases deleted (0 if the batch failed and was rolled back)."""
+    case_ids = list(case_ids)
+    try:
+        with _LOCK:
+            conn = _get_conn()
+            with conn: # Commits on success, rolls back on error
+                deleted = conn.executemany(_DELETE_CASE_SQL, ((case_id,) for case_id in case_ids)).rowcount
+            invalidate_cases_cache()
+        logging.info(f"{deleted} case(s) deleted from DB.")
+        return deleted
+    except Exception as e:
+        logging.error(f"Failed to delete {len(case_ids)} case(s) from DB: {e}")
+        return 0
+
+def delete_case_db(case_id):
+    """Deletes a case record from the database by its ID."""
+    if delete_cases_db([case_id]):
+        logging.info(f"Case ID {case_id} deleted successfully from DB.")
+        return True
+    logging.error(f"Failed to delete case ID {case_id} from DB.")
+    return False
 
 
 def generate_salt(length=16):
     """Generates a random salt for password hashing."""
     return secrets.token_hex(length)
 
+SCRYPT_HASH_PREFIX = "scrypt$" # Marks hashes made by hash_password; older hashes are bare PBKDF2 hex
+
 def hash_password(password, salt):
-    """Hashes a password using PBKDF2."""
-    # Use a strong KDF like PBKDF2
-    # It's recommended to use a higher number of iterations in production
+    """Hashes a password using scrypt (memory-hard, a single call)."""
+    hashed = hashlib.scrypt(password.encode('utf-8'), # Convert password to bytes
+                            salt=salt.encode('utf-8'), # Convert salt to bytes
+                            n=16384, r=8, p=1, dklen=32)
+    return SCRYPT_HASH_PREFIX + hashed.hex() # Convert hash to hex string for storage
+
+def hash_password_pbkdf2(password, salt):
+    """Hashes a password using PBKDF2, as stored by earlier versions."""
     hashed = hashlib.pbkdf2_hmac('sha256',
                                  password.encode('utf-8'), # Convert password to bytes
                                  salt.encode('utf-8'),     # Convert salt to bytes
                                  100000) # Number of iterations
     return hashed.hex() # Convert hash to hex string for storage
 
+# (stored hash, SHA-256 of salt + password, expiry) for the last password that verified, so
+# re-entering that same password shortly after skips the slow key derivation. Any other guess
+# still goes through scrypt, so the cache never makes brute-forcing cheaper.
+_verified_password = None
+VERIFIED_PASSWORD_TTL_SECONDS = 300
+
 def verify_password(password):
-    """Verifies a password against the stored hash and salt."""
-    conn = None
+    """Verifies a password against the stored hash and salt.
+    Legacy PBKDF2 hashes are upgraded to scrypt after a successful check."""
+    global _verified_password
     try:
-        conn = sqlite3.connect(DB_FILENAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = 'password_hash'")
-        stored_hash_row = cursor.fetchone()
-        cursor.execute("SELECT value FROM settings WHERE key = 'salt'")
-        stored_salt_row = cursor.fetchone()
+        with _LOCK:
+            cursor = _get_conn().cursor()
+            cursor.execute("SELECT value FROM settings WHERE key = 'password_hash'")
+            stored_hash_row = cursor.fetchone()
+            cursor.execute("SELECT value FROM settings WHERE key = 'salt'")
+            stored_salt_row = cursor.fetchone()
 
         if stored_hash_row and stored_salt_row:
             stored_hash = stored_hash_row[0]
             stored_salt = stored_salt_row[0]
+            token = hashlib.sha256((stored_salt + password).encode('utf-8')).digest()
+            if (_verified_password and _verified_password[0] == stored_hash
+                    and time.monotonic() < _verified_password[2]
+                    and secrets.compare_digest(_verified_password[1], token)):
+                return True
             # Hash the provided password with the stored salt
-            hashed_provided_password = hash_password(password, stored_salt)
-            return hashed_provided_password == stored_hash
+            if stored_hash.startswith(SCRYPT_HASH_PREFIX):
+                verified = secrets.compare_digest(hash_password(password, stored_salt), stored_hash)
+            else:
+                verified = secrets.compare_digest(hash_password_pbkdf2(password, stored_salt), stored_hash)
+                if verified:
+                    update_password_db(password) # Re-hash with scrypt
+                    return True
+            if verified:
+                _verified_password = (stored_hash, token, time.monotonic() + VERIFIED_PASSWORD_TTL_SECONDS)
+            return verified
         else:
             logging.warning("Password hash or salt not found in settings DB.")
             return False # Should not happen if init_db runs correctly
     except Exception as e:
         logging.error(f"Error verifying password: {e}")
         return False
-    finally:
-        if conn:
-            conn.close()
 
 def update_password_db(new_password):
     """Updates the stored password hash and salt in the database."""
-    conn = None
     try:
-        conn = sqlite3.connect(DB_FILENAME)
-        cursor = conn.cursor()
         salt = generate_salt()
         hashed_password = hash_password(new_password, salt)
-        cursor.execute("REPLACE INTO settings (key, value) VALUES (?, ?)", ('password_hash', hashed_password))
-        cursor.execute("REPLACE INTO settings (key, value) VALUES (?, ?)", ('salt', salt))
-        conn.commit()
+        with _LOCK:
+            conn = _get_conn()
+            with conn:
+                conn.execute("REPLACE INTO settings (key, value) VALUES (?, ?)", ('password_hash', hashed_password))
+                conn.execute("REPLACE INTO settings (key, value) VALUES (?, ?)", ('salt', salt))
         logging.info("Password updated successfully in DB.")
         return True
     except Exception as e:
         logging.error(f"Error updating password in DB: {e}")
         return False
-    finally:
-        if conn:
-            conn.close()
 
 
+_combo_values_cache = None # {key: values} for every combo_* setting, loaded by get_all_combo_values_db()
+
+def invalidate_combo_values_cache():
+    """Drops the in-memory combo values; call after changing combo_* settings outside set_combo_values_db."""
+    global _combo_values_cache
+    with _LOCK:
+        _combo_values_cache = None
+
+def get_all_combo_values_db():
+    """Returns {key: values} for all stored combo lists (user prefs included), read with one query
+    on first use and kept in memory afterwards."""
+    global _combo_values_cache
+    with _LOCK:
+        if _combo_values_cache is None:
+            cache = {}
+            try:
+                cursor = _get_conn().cursor()
+                cursor.execute("SELECT key, value FROM settings WHERE key LIKE 'combo%'")
+                for key, value in cursor.fetchall():
+                    if not key.startswith("combo_") or not value:
+                        continue
+                    try:
+                        # Use JSON for robust storage
+                        cache[key[len("combo_"):]] = orjson.loads(value) if orjson else json.loads(value)
+                    except ValueError as e:
+                        logging.error(f"Error decoding combo values for '{key}': {e}")
+                _combo_values_cache = cache
+            except Exception as e:
+                logging.error(f"Error retrieving combo values: {e}")
+                return {}
+        return _combo_values_cache
+
 def get_combo_values_db(key):
     """Retrieve a list of combo values for a given key from the settings table."""
-    conn = None
+    # Copy so callers can append to the list before saving it back
+    return list(get_all_combo_values_db().get(key, []))
+
+def set_combo_values_many_db(updates):
+    """Store several combo value lists ({key: values}) in the settings table in one transaction."""
+    if not updates:
+        return
     try:
-        conn = sqlite3.connect(DB_FILENAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (f"combo_{key}",))
-        row = cursor.fetchone()
-        if row and row[0]:
-            # Use JSON for robust storage
-            return json.loads(row[0])
-        return []
+        dumps = (lambda values: orjson.dumps(values).decode()) if orjson else json.dumps
+        rows = [(f"combo_{key}", dumps(values)) for key, values in updates.items()]
+        with _LOCK:
+            conn = _get_conn()
+            with conn:
+                conn.executemany("REPLACE INTO settings (key, value) VALUES (?, ?)", rows)
+            if _combo_values_cache is not None:
+                for key, values in updates.items():
+                    _combo_values_cache[key] = list(values)
     except Exception as e:
-        logging.error(f"Error retrieving combo values for '{key}': {e}")
-        return []
-    finally:
-        if conn:
-            conn.close()
+        logging.error(f"Error saving combo values for {list(updates)}: {e}")
+
+def add_combo_values_db(values_by_key):
+    """Appends each {key: value} to its stored combo list if it isn't there yet.
+    Checked against the in-memory combo cache, so nothing is written (and no query runs) unless a
+    value is new; new values for all keys are saved in one transaction. Returns the updated keys."""
+    with _LOCK:
+        stored = get_all_combo_values_db()
+        updates = {key: stored.get(key, []) + [value] for key, value in values_by_key.items()
+                   if value and value not in stored.get(key, ())}
+        set_combo_values_many_db(updates)
+    return list(updates)
 
 def set_combo_values_db(key, values):
     """Store a list of combo values for a given key in the settings table."""
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_FILENAME)
-        cursor = conn.cursor()
-        value_str = json.dumps(values)
-        cursor.execute("REPLACE INTO settings (key, value) VALUES (?, ?)", (f"combo_{key}", value_str))
-        conn.commit()
-    except Exception as e:
-        logging.error(f"Error saving combo values for '{key}': {e}")
-    finally:
-        if conn:
-            conn.close()
+    set_combo_values_many_db({key: values})
 
 def set_user_pref(key, value):
     set_combo_values_db(f"userpref_{key}", [value])
@@ -521,17 +1087,29 @@ def format_date_str_for_display(date_str):
     """Formats aYYYY-MM-DD date string to MM-DD-YYYY for display."""
     if not date_str:
         return ""
+    s = str(date_str)
+    # Fast path: DB dates are YYYY-MM-DD, optionally followed by " HH:MM:SS"; just reorder the slices.
+    # Not cached: created_at timestamps are nearly all distinct and would only churn a cache
+    if (len(s) == 10 or (len(s) == 19 and s[10] == ' ')) and s[4] == '-' and s[7] == '-' \
+            and s[0:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit():
+        return f"{s[5:7]}-{s[8:10]}-{s[0:4]}"
+    return _format_other_date_for_display(s)
+
+@functools.lru_cache(maxsize=1024)
+def _format_other_date_for_display(date_str):
+    """strptime-based fallback for format_date_str_for_display; cached per distinct value,
+    so an unparseable value is also only logged once."""
     try:
         # Attempt to parse bothYYYY-MM-DD andYYYY-MM-DD HH:MM:SS formats
         try:
-            date_obj = datetime.strptime(str(date_str), '%Y-%m-%d').date()
+            date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
         except ValueError: # Try with time if initial parse fails
-             date_obj = datetime.strptime(str(date_str), '%Y-%m-%d %H:%M:%S').date()
+             date_obj = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S').date()
 
         return date_obj.strftime('%m-%d-%Y')
     except Exception:
         logging.warning(f"Could not parse date string '{date_str}' for display formatting.")
-        return str(date_str) # Return original if parsing fails
+        return date_str # Return original if parsing fails
 
 
 def format_bool_int(value):
@@ -544,15 +1122,361 @@ def format_bool_int(value):
         return "" # Handle None or other values
 
 
+GEOCODE_WORKERS = 2 # Lets the next request start while one waits on the network; still 1 req/s
+PUBLIC_NOMINATIM_DOMAIN = "nominatim.openstreetmap.org"
+PUBLIC_NOMINATIM_MIN_DELAY = 1.0 # Seconds between requests required by the public server's usage policy
+_GEOCODE = None # Shared rate-limited geocode function, created by get_geocoder()
+_GEOCODER_LOCK = threading.Lock()
+
+def get_geocode_workers():
+    """Number of concurrent geocoding requests, from the 'geocode_workers' user pref.
+    Only worth raising together with 'geocode_min_delay' for a self-hosted Nominatim."""
+    try:
+        return max(1, int(get_user_pref('geocode_workers', GEOCODE_WORKERS)))
+    except (TypeError, ValueError):
+        return GEOCODE_WORKERS
+
+def get_geocoder():
+    """Returns the shared Nominatim geocode function.
+    One geocoder keeps a single keep-alive HTTP session, and the RateLimiter holds
+    every caller (map thread and UI) to the configured request rate. The 'geocode_domain'
+    and 'geocode_min_delay' user prefs point it at a self-hosted server with a higher rate;
+    the public server is never queried faster than once per second."""
+    global _GEOCODE
+    with _GEOCODER_LOCK:
+        if _GEOCODE is None:
+            domain = get_user_pref('geocode_domain') or PUBLIC_NOMINATIM_DOMAIN
+            try:
+                min_delay = float(get_user_pref('geocode_min_delay', PUBLIC_NOMINATIM_MIN_DELAY))
+            except (TypeError, ValueError):
+                min_delay = PUBLIC_NOMINATIM_MIN_DELAY
+            if domain == PUBLIC_NOMINATIM_DOMAIN:
+                min_delay = max(min_delay, PUBLIC_NOMINATIM_MIN_DELAY)
+            geolocator = Nominatim(user_agent=APP_NAME, domain=domain, timeout=10, adapter_factory=RequestsAdapter)
+            _GEOCODE = RateLimiter(geolocator.geocode, min_delay_seconds=max(min_delay, 0.0))
+        return _GEOCODE
+
+
+_LOGO_READER = None # Cached ImageReader for report logos; False once the logo is known to be missing
+
+def get_logo_reader():
+    """Returns a cached reportlab ImageReader for the logo, or None if there is no logo file.
+    Reports reuse it instead of stat'ing and re-opening the file on every export."""
+    global _LOGO_READER
+    if _LOGO_READER is None:
+        _LOGO_READER = ImageReader(LOGO_FILENAME) if os.path.exists(LOGO_FILENAME) else False
+    return _LOGO_READER or None
+
+# Large sources are first shrunk by an integer factor (cheap box reduce) to within this
+# multiple of the target size, so LANCZOS only filters a few pixels per output pixel
+IMAGE_REDUCING_GAP = 3.0
+
+# Largest stored logo / marker icon; selected images are shrunk to fit before they are saved.
+# The logo is shown 100px high and printed 1 inch high in reports; the icon at most 50x50.
+LOGO_MAX_SIZE = (512, 512)
+MARKER_ICON_MAX_SIZE = (128, 128)
+
+def save_image_as_png(source, dest, max_size):
+    """Saves the image file source to dest as PNG, shrunk (keeping its aspect ratio) to fit max_size,
+    so later loads and report exports don't decode a full-resolution original."""
+    with Image.open(source) as image:
+        image.thumbnail(max_size, Image.Resampling.LANCZOS, reducing_gap=IMAGE_REDUCING_GAP)
+        image.convert('RGBA').save(dest, 'PNG', optimize=True)
+
+def decode_logo_image(path):
+    """Opens the logo and scales it to 100px high, keeping its aspect ratio.
+    Pure PIL work, so it can run off the Tk thread."""
+    image = Image.open(path)
+    aspect_ratio = image.size[0] / image.size[1]
+    new_height = 100
+    return image.resize((int(new_height * aspect_ratio), new_height), Image.Resampling.LANCZOS,
+                        reducing_gap=IMAGE_REDUCING_GAP)
+
+def decode_marker_icon_image(path):
+    """Opens the marker icon and returns (20x20 map image, 50x50 preview image).
+    The file is decoded once; both sizes are resampled from that source."""
+    image = Image.open(path)
+    image.load()
+    return tuple(image.resize(size, Image.Resampling.LANCZOS, reducing_gap=IMAGE_REDUCING_GAP)
+                 for size in ((20, 20), (50, 50)))
+
+_DECODED_IMAGES = {} # (decode function name, path) -> (mtime_ns, size, decoded result)
+
+def cached_image_decode(decode, path):
+    """Returns decode(path), reusing the last result while the file's mtime and size are unchanged.
+    Decoded PIL images are shared between callers, so treat them as read-only."""
+    st = os.stat(path)
+    key = (decode.__name__, os.path.abspath(path))
+    cached = _DECODED_IMAGES.get(key)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    result = decode(path)
+    _DECODED_IMAGES[key] = (st.st_mtime_ns, st.st_size, result)
+    return result
+
+def invalidate_logo_reader():
+    """Drops the cached report logo so the next export re-reads the logo file."""
+    global _LOGO_READER
+    _LOGO_READER = None
+
+
+# Fields broken down in the total case summary, with their report labels
+SUMMARY_BREAKDOWN_FIELDS = [("examiner", "Examiner"), ("agency", "Agency"), ("offense_type", "Offense Type"), ("device_type", "Device Type")]
+
+def summarize_cases(cases):
+    """Totals volume and counts each breakdown field's values, column-wise with pandas.
+    Returns (total_gb, {field: [(value, count), ...]}) with the most common values first."""
+    breakdowns = {field: [] for field, _ in SUMMARY_BREAKDOWN_FIELDS}
+    # Only build the columns the summary reads, not every field of every case
+    df = pd.DataFrame(cases, columns=['volume_size_gb', *breakdowns])
+    if df.empty:
+        return 0.0, breakdowns
+    total_gb = float(pd.to_numeric(df['volume_size_gb'], errors='coerce').fillna(0).sum())
+    for field in breakdowns:
+        values = df[field].fillna('').astype(str).str.strip()
+        counts = values[values != ''].value_counts(sort=False).sort_values(ascending=False, kind='stable')
+        breakdowns[field] = [(value, int(count)) for value, count in counts.items()]
+    return total_gb, breakdowns
+
+
+LOG_VIEW_MAX_BYTES = 256 * 1024 # The log viewer shows at most this much of the end of the log
+
+def read_log_tail(path, max_bytes=LOG_VIEW_MAX_BYTES):
+    """Returns the last max_bytes of a text file, starting at a line boundary when truncated,
+    so the log viewer's cost doesn't grow with the log."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - max_bytes))
+        data = f.read()
+    text = data.decode('utf-8', errors='replace')
+    if size > max_bytes:
+        text = f"... (showing the last {max_bytes // 1024} KB of the log)\n" + text.split('\n', 1)[-1]
+    return text
+
+
+def write_xlsx_sheets(filename, sheets):
+    """Writes (sheet title, header list, row iterable) sheets to an .xlsx file.
+    Uses openpyxl's write-only mode, so rows are streamed out as they are produced
+    instead of being collected into a DataFrame first."""
+    wb = openpyxl.Workbook(write_only=True)
+    for title, headers, rows in sheets:
+        ws = wb.create_sheet(title)
+        ws.append(list(headers))
+        for row in rows:
+            ws.append(list(row))
+    wb.save(filename)
+
+
+def pdf_table_cells(rows, font_size):
+    """Returns rows for a fixed-width PDF table, with each non-empty value as a Paragraph so
+    long text (notes, agency names) wraps within its column instead of running into the next."""
+    style = ParagraphStyle('ReportCell', fontName='Helvetica', fontSize=font_size, leading=font_size + 2)
+    return [[Paragraph(xml_escape(str(value)), style) if value not in (None, '') else '' for value in row]
+            for row in rows]
+
+
+def read_excel_file(filename):
+    """Reads the first sheet of an .xlsx file into a DataFrame.
+    Uses the calamine engine when python-calamine is installed, which parses in native code
+    instead of building openpyxl's cell objects; otherwise openpyxl."""
+    if python_calamine:
+        return pd.read_excel(filename, engine='calamine')
+    return pd.read_excel(filename, engine='openpyxl')
+
+
+IMPORT_STREAM_MIN_BYTES = 5_000_000 # Workbooks at least this large are streamed instead of read whole
+IMPORT_CHUNK_ROWS = 10_000 # Rows per DataFrame/insert batch when streaming an import
+
+def iter_excel_frames(filename, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Yields the first sheet of an .xlsx file as DataFrames with stripped column headers.
+    Small files come back as one frame; large ones are streamed with openpyxl in read-only mode,
+    chunk_rows rows at a time, so the whole sheet is never held in memory."""
+    if os.path.getsize(filename) < IMPORT_STREAM_MIN_BYTES:
+        df = read_excel_file(filename)
+        df.columns = [str(col).strip() for col in df.columns]
+        yield df
+        return
+    wb = openpyxl.load_workbook(filename, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = []
+        for col in next(rows, ()):
+            name = str(col).strip() if col is not None else ""
+            # Rename repeated headers the way read_excel does ("Notes", "Notes.1", ...)
+            base, n = name, 0
+            while name in header:
+                n += 1
+                name = f"{base}.{n}"
+            header.append(name)
+        width = len(header)
+        chunk = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue # Skip blank rows, as read_excel does
+            # Read-only sheets can return short or long rows; line them up with the header
+            chunk.append(row[:width] + (None,) * (width - len(row)))
+            if len(chunk) >= chunk_rows:
+                yield pd.DataFrame(chunk, columns=header)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=header)
+    finally:
+        wb.close()
+
+
+IMPORT_YES_VALUES = frozenset({'yes', 'true', '1'}) # Casefolded cell text read as "yes" for the import's flag columns
+YES_NO_LABELS = {True: "Yes", False: "No"}
+
+def _parse_import_date(value):
+    """Parses one spreadsheet date cell to YYYY-MM-DD, or None if it can't be read.
+    Each value is parsed on its own, so a column may mix date formats."""
+    try:
+        return pd.to_datetime(value).strftime('%Y-%m-%d')
+    except Exception:
+        return None
+
+def convert_import_frame(df, excel_header_to_db_key):
+    """Converts one DataFrame of imported spreadsheet rows into case dicts for add_cases_db.
+    excel_header_to_db_key maps the sheet's column headers to case_log columns."""
+    # Convert whole columns at once instead of visiting each cell in a Python loop
+    converted = pd.DataFrame(index=df.index)
+    for excel_col, db_key in excel_header_to_db_key.items():
+        column = df[excel_col]
+        present = column.notna()
+
+        # Handle dates; unparseable values become None
+        if db_key in ['start_date', 'end_date']:
+            # Dates repeat heavily across cases, so parse and format each distinct value once;
+            # blank text parses to None like any other unreadable value
+            iso_by_value = {value: _parse_import_date(value) for value in column.dropna().unique()}
+            dates = column.map(iso_by_value)
+            converted[db_key] = dates.astype(object).where(dates.notna(), None)
+
+        # Convert boolean fields (True/"yes"/"true"/"1" count as yes)
+        elif db_key in ['fpr_complete', 'data_recovered']:
+            if column.dtype.kind in 'biuf':
+                # Numeric/bool column: compare in C; as text, a float 1.0 would read "1.0" and miss
+                is_yes = (column == 1) & present
+            else:
+                is_yes = column.astype(str).str.strip().str.casefold().isin(IMPORT_YES_VALUES) & present
+            if db_key == 'fpr_complete':
+                converted[db_key] = is_yes.astype(int)
+            else:
+                converted[db_key] = is_yes.map(YES_NO_LABELS).where(present, "")
+
+        # Handle all other fields; text cells are trimmed and blank ones stored as None
+        else:
+            # Text columns are object dtype, or a string dtype (read_excel's default from pandas 3)
+            if column.dtype == object or pd.api.types.is_string_dtype(column.dtype):
+                try:
+                    stripped = column.str.strip()
+                except AttributeError: # No text cells in this column
+                    stripped = None
+                if stripped is not None:
+                    column = stripped.where(stripped.notna(), column) # Non-text cells keep their value
+                    # String dtypes compare missing cells as NA; those are already excluded by present
+                    present = present & column.ne('').fillna(False).astype(bool)
+            converted[db_key] = column.astype(object).where(present, None)
+
+    return converted.to_dict(orient='records')
+
+
+def get_unique_field_values_many(fields):
+    """Return {field: list of unique values} for several fields.
+    Reads the case cache when it is current, otherwise one SELECT DISTINCT over just those columns."""
+    with _LOCK:
+        missing = [field for field in fields if (_cases_version, field) not in _unique_values_cache]
+        if missing:
+            values = {field: set() for field in missing}
+            columns = [field for field in missing if field in CASE_COLUMNS]
+            if _cases_cache is not None and _cases_cache[0] == _cases_version:
+                rows = ([case.get(field) for field in columns] for case in _cases_cache[1])
+            elif columns:
+                try:
+                    cursor = _get_conn().cursor()
+                    rows = cursor.execute(f"SELECT DISTINCT {', '.join(columns)} FROM case_log").fetchall()
+                except Exception as e:
+                    logging.error(f"Error retrieving unique values for {columns}: {e}")
+                    rows = []
+            else:
+                rows = []
+            for row in rows:
+                for field, val in zip(columns, row):
+                    val = (val or "").strip()
+                    if val:
+                        values[field].add(val)
+            for field in missing:
+                _unique_values_cache[(_cases_version, field)] = sorted(values[field])
+        return {field: list(_unique_values_cache[(_cases_version, field)]) for field in fields}
+
 def get_unique_field_values(field):
     """Return a list of unique values for a given field from all cases."""
-    cases = get_all_cases_db()
-    values = set()
-    for case in cases:
-        val = (case.get(field) or "").strip()
-        if val:
-            values.add(val)
-    return sorted(values)
+    return get_unique_field_values_many([field])[field]
+
+def init_map_tile_store():
+    """Creates the map tile store (the tiles table tkintermapview's offline loader uses) if it is missing."""
+    try:
+        conn = sqlite3.connect(MAP_TILE_CACHE_FILENAME)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL") # Map loader threads keep reading while one stores a tile
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tiles (
+                    zoom INTEGER NOT NULL,
+                    x INTEGER NOT NULL,
+                    y INTEGER NOT NULL,
+                    server VARCHAR(300) NOT NULL,
+                    tile_image BLOB NOT NULL,
+                    CONSTRAINT pk_tiles PRIMARY KEY (zoom, x, y, server)
+                )
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logging.warning(f"Could not create the map tile store: {e}")
+
+class TileStoreMapView(tkintermapview.TkinterMapView):
+    """TkinterMapView that also saves the tiles it downloads into its database_path store,
+    so an area browsed once is drawn from disk in later sessions. Downloads identify the app
+    and share MAP_TILE_DOWNLOAD_SLOTS."""
+
+    def request_image(self, zoom, x, y, db_cursor=None):
+        # Runs on the widget's loader threads, each with its own db_cursor.
+        # Overlay tiles are composited from two servers; leave those to the stock loader.
+        if db_cursor is None or self.overlay_tile_server is not None:
+            return super().request_image(zoom, x, y, db_cursor=db_cursor)
+        server = self.tile_server
+        try:
+            db_cursor.execute("SELECT tile_image FROM tiles WHERE zoom = ? AND x = ? AND y = ? AND server = ?",
+                              (zoom, x, y, server))
+            row = db_cursor.fetchone()
+            if row is not None:
+                image = Image.open(io.BytesIO(row[0]))
+            else:
+                url = server.replace("{x}", str(x)).replace("{y}", str(y)).replace("{z}", str(zoom))
+                with MAP_TILE_DOWNLOAD_SLOTS:
+                    response = requests.get(url, headers={"User-Agent": MAP_TILE_USER_AGENT}, timeout=10)
+                response.raise_for_status()
+                image = Image.open(io.BytesIO(response.content))
+                image.load() # Only store tiles that decode
+                try:
+                    db_cursor.execute("INSERT OR IGNORE INTO tiles (zoom, x, y, server, tile_image) VALUES (?, ?, ?, ?, ?)",
+                                      (zoom, x, y, server, response.content))
+                    db_cursor.connection.commit()
+                except sqlite3.Error as e:
+                    logging.debug(f"Map tile {zoom}/{x}/{y} not stored: {e}") # Downloaded again next session
+            if not self.running:
+                return self.empty_tile_image
+            image_tk = ImageTk.PhotoImage(image)
+            self.tile_image_cache[f"{zoom}{x}{y}"] = image_tk
+            return image_tk
+        except UnidentifiedImageError:
+            # No image for these coordinates; remember that, like the stock loader does
+            self.tile_image_cache[f"{zoom}{x}{y}"] = self.empty_tile_image
+            return self.empty_tile_image
+        except Exception:
+            return self.empty_tile_image # Offline or server error; retried when the tile is shown again
 
 
 # --- Main Application Class ---
@@ -570,15 +1494,36 @@ class CaseLogApp:
         # Center the map on the selected state (if possible)
         if not self.map_widget or not state:
             return
-        # Use geopy to get the center of the state
-        try:
-            geolocator = Nominatim(user_agent=APP_NAME)
-            location = geolocator.geocode(f"{state}, USA", timeout=10)
-            if location:
-                self.map_widget.set_position(location.latitude, location.longitude)
-                self.map_widget.set_zoom(6)  # Reasonable zoom for a state
-        except Exception as e:
-            logging.warning(f"Could not focus map on state '{state}': {e}")
+        location_key = f"STATE|{state}"
+        coords = get_cached_location(location_key)
+        if coords:
+            self._set_map_state_focus(coords)
+            return
+        # Use geopy to get the center of the state, off the UI thread
+        def worker():
+            try:
+                location = get_geocoder()(f"{state}, USA")
+                if location:
+                    add_cached_location_db(location_key, location.latitude, location.longitude)
+                    self.root.after(0, self._set_map_state_focus, (location.latitude, location.longitude))
+            except Exception as e:
+                logging.warning(f"Could not focus map on state '{state}': {e}")
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _debounce(self, key, ms, fn):
+        """Run fn after ms milliseconds, replacing any call still pending under the same key."""
+        existing = self._debounce_ids.pop(key, None)
+        if existing:
+            self.root.after_cancel(existing)
+        def run():
+            self._debounce_ids.pop(key, None)
+            fn()
+        self._debounce_ids[key] = self.root.after(ms, run)
+
+    def _set_map_state_focus(self, coords):
+        if self.map_widget:
+            self.map_widget.set_position(*coords)
+            self.map_widget.set_zoom(6)  # Reasonable zoom for a state
     def get_report_header_info(self):
         info = get_user_pref('report_header_info')
         if info and isinstance(info, dict):
@@ -622,69 +1567,237 @@ class CaseLogApp:
         win.wait_window()
     # --- Lazy Loading for View Data Treeview ---
     LAZY_PAGE_SIZE = 200  # Number of rows to load per page
+    LAZY_MAX_ROWS = 1000  # Most rows kept in the Treeview; pages scrolled far out of view are dropped
 
     def init_lazy_loading(self):
-        self._lazy_offset = 0
+        self._lazy_offset = 0 # Position in the results just past the last row in the Treeview
+        self._lazy_start = 0 # Position of the first row in the Treeview (rows above were trimmed)
         self._lazy_total = 0
-        self._lazy_cases = []
+        self._lazy_first_id = None # id of the first row in the Treeview, for paging back up
+        self._lazy_last_id = None # id of the last loaded row, for keyset paging
         self._lazy_filter = None
         self._lazy_loading = False
+        self._lazy_sort_ids = None # Case ids in display order while a column sort is active; pages are slices
 
     def refresh_data_view(self, filter_text=None, reset_lazy=True):
-        """Refresh the Treeview with lazy loading support."""
-        # If no filter_text provided, try to use existing filter
+        """Refresh the Treeview with lazy loading support.
+        On reset the count and first page are read on a background thread."""
+        # If no filter_text provided, use the current (already normalized) filter
         if filter_text is None:
-            filter_text = getattr(self, '_view_filter_string', '') if hasattr(self, '_view_filter_string') else ''
-        
+            filter_text = self._view_filter_string
+
         if reset_lazy:
             self.init_lazy_loading()
             self._lazy_filter = filter_text
-            self._lazy_cases = self.get_filtered_cases(filter_text)
-            self._lazy_total = len(self._lazy_cases)
-            self._lazy_offset = 0
-        self.tree.delete(*self.tree.get_children())
+            self._lazy_loading = True # No scroll-triggered pages until the first page is shown
+            self._lazy_generation += 1
+            threading.Thread(
+                target=self._load_cases_worker,
+                args=(self._lazy_generation, filter_text, self._lazy_page_columns(),
+                      self.treeview_sort_column, self.treeview_sort_reverse),
+                daemon=True
+            ).start()
+            self.root.after(50, self._drain_cases_queue, self._lazy_generation)
+            return
+        self._clear_tree_rows()
         self.load_next_lazy_page()
 
-    def get_filtered_cases(self, filter_text):
-        """Return filtered cases for the current filter/search text."""
-        all_cases = get_all_cases_db()
-        if not filter_text:
-            return all_cases
-        filter_text = filter_text.lower().strip()
-        filtered = []
-        for case in all_cases:
-            for v in case.values():
-                if v and filter_text in str(v).lower():
-                    filtered.append(case)
+    def _load_cases_worker(self, generation, filter_text, columns, sort_column=None, sort_reverse=False):
+        """Background thread: count the matching cases and read the first page
+        (with sort_column set, in that column's order)."""
+        if sort_column:
+            sort_ids = self._sorted_case_ids(sort_column, filter_text, sort_reverse)
+            total = len(sort_ids)
+            rows = get_case_rows_by_ids_db(columns, sort_ids[:self.LAZY_PAGE_SIZE])
+        else:
+            sort_ids = None
+            total = count_cases_db(filter_text)
+            rows = get_cases_page_db(columns, filter_text, None, self.LAZY_PAGE_SIZE)
+        self._cases_queue.put((generation, total, rows, sort_ids))
+
+    def _sorted_case_ids(self, column, filter_text, reverse):
+        """Returns the case ids for filter_text ordered by column. The order is cached per column
+        and filter until the next write, so repeat clicks only flip direction."""
+        key = (column, filter_text)
+        cached = self._sort_cache.get(key)
+        if cached is None or cached[0] != _cases_version:
+            version = _cases_version # Read first: a write during the query leaves this entry stale
+            ascending = get_sorted_case_ids_db(column, filter_text)
+            cached = (version, ascending, ascending[::-1])
+            # Orders read before the last write are stale; keep only current ones
+            self._sort_cache = {k: v for k, v in self._sort_cache.items() if v[0] == version}
+            self._sort_cache[key] = cached
+        return cached[2] if reverse else cached[1]
+
+    def sort_treeview_column(self, column):
+        """Heading click: sorts the View Data rows by column; clicking the same heading again reverses it."""
+        if self.treeview_sort_column == column:
+            self.treeview_sort_reverse = not self.treeview_sort_reverse
+        else:
+            if self.treeview_sort_column:
+                previous = self.treeview_sort_column
+                self.tree.heading(previous, text=self.tree_columns_config[previous]["text"])
+            self.treeview_sort_column = column
+            self.treeview_sort_reverse = False
+        arrow = " \u25bc" if self.treeview_sort_reverse else " \u25b2"
+        self.tree.heading(column, text=self.tree_columns_config[column]["text"] + arrow)
+        self.refresh_data_view()
+
+    def _drain_cases_queue(self, generation):
+        """Show the first page once the worker for this refresh has finished."""
+        if generation != self._lazy_generation:
+            return # A newer refresh has its own polling loop
+        try:
+            while True:
+                result_generation, total, rows, sort_ids = self._cases_queue.get_nowait()
+                if result_generation == generation:
                     break
-        return filtered
+        except queue.Empty:
+            self.root.after(50, self._drain_cases_queue, generation)
+            return
+        self._lazy_total = total
+        self._lazy_sort_ids = sort_ids
+        self._clear_tree_rows()
+        self._insert_lazy_rows(rows)
+        self._lazy_loading = False
+
+    def _lazy_page_columns(self):
+        """Columns to read for a page: id and the displayed columns; hidden ones are filled with ""."""
+        shown = set(self.get_visible_treeview_columns()) | {'id'}
+        return [col if col in shown else None for col in self.tree["columns"]]
+
+    def _insert_lazy_rows(self, rows):
+        """Append a page of row tuples to the Treeview and advance the paging position.
+        Once the Treeview holds more than LAZY_MAX_ROWS rows, the oldest rows are dropped from the top."""
+        self._bulk_insert_rows(rows)
+        if rows:
+            id_index = self.tree["columns"].index('id')
+            if self._lazy_first_id is None:
+                self._lazy_first_id = rows[0][id_index]
+            self._lazy_last_id = rows[-1][id_index]
+            self._lazy_offset += len(rows)
+            self._trim_lazy_rows(from_top=True)
+        else:
+            self._lazy_offset = self._lazy_total # Rows were deleted since the count; stop paging
+
+    def _bulk_insert_rows(self, rows, index="end"):
+        """Insert row tuples into the Treeview at index ("end" or a position), in order.
+        The scrollbar is updated once at the end rather than for every inserted row."""
+        yscrollcommand = self.tree.cget('yscrollcommand')
+        self.tree.configure(yscrollcommand='')
+        try:
+            # Call the Tcl insert command directly: Treeview.insert() re-formats the options and
+            # joins the values into an escaped string per row, while a tuple passed to tk.call
+            # becomes a Tcl list as is
+            call, widget = self.tree.tk.call, self.tree._w
+            lazy_rows = self._lazy_rows
+            if index == "end":
+                for row in rows:
+                    lazy_rows[call(widget, "insert", "", "end", "-values", row)] = row
+            else:
+                for position, row in enumerate(rows, index):
+                    lazy_rows[call(widget, "insert", "", position, "-values", row)] = row
+        finally:
+            self.tree.configure(yscrollcommand=yscrollcommand)
+            self.tree_vsb.set(*self.tree.yview())
+
+    def _clear_tree_rows(self):
+        """Deletes every row from the Treeview along with its cached values."""
+        self.tree.delete(*self.tree.get_children())
+        self._lazy_rows.clear()
+
+    def _tree_row_values(self, iid):
+        """Returns the value tuple (in tree['columns'] order) of a Treeview row.
+        Rows inserted by the lazy loader are answered from _lazy_rows without a Tcl call."""
+        row = self._lazy_rows.get(iid)
+        return row if row is not None else self.tree.item(iid, 'values')
+
+    def _trim_lazy_rows(self, from_top):
+        """Keep at most LAZY_MAX_ROWS items in the Treeview by deleting rows from one end,
+        holding the rows on screen in place."""
+        children = self.tree.get_children()
+        excess = len(children) - self.LAZY_MAX_ROWS
+        if excess <= 0:
+            return
+        first_visible = int(self.tree.yview()[0] * len(children))
+        id_index = self.tree["columns"].index('id')
+        if from_top:
+            self.tree.delete(*children[:excess])
+            for iid in children[:excess]:
+                self._lazy_rows.pop(iid, None)
+            self._lazy_start += excess
+            self._lazy_first_id = self._tree_row_values(children[excess])[id_index]
+            self.tree.yview_moveto(max(first_visible - excess, 0) / self.LAZY_MAX_ROWS)
+        else:
+            self.tree.delete(*children[-excess:])
+            for iid in children[-excess:]:
+                self._lazy_rows.pop(iid, None)
+            self._lazy_offset -= excess
+            self._lazy_last_id = self._tree_row_values(children[-excess - 1])[id_index]
 
     def load_next_lazy_page(self):
         """Load the next page of cases into the Treeview."""
         if self._lazy_loading:
             return
         self._lazy_loading = True
-        start = self._lazy_offset
-        end = min(start + self.LAZY_PAGE_SIZE, self._lazy_total)
-        cases = self._lazy_cases[start:end]
-        visible_columns = self.get_visible_treeview_columns()
-        for case in cases:
-            values = [case.get(col, "") for col in self.tree["columns"]]
-            self.tree.insert("", "end", values=values)
-        self._lazy_offset = end
-        self._lazy_loading = False
+        try:
+            if self._lazy_sort_ids is not None:
+                page_ids = self._lazy_sort_ids[self._lazy_offset:self._lazy_offset + self.LAZY_PAGE_SIZE]
+                rows = get_case_rows_by_ids_db(self._lazy_page_columns(), page_ids)
+            else:
+                rows = get_cases_page_db(self._lazy_page_columns(), self._lazy_filter, self._lazy_last_id, self.LAZY_PAGE_SIZE)
+            self._insert_lazy_rows(rows)
+        finally:
+            self._lazy_loading = False
+
+    def load_previous_lazy_page(self):
+        """Load the page of cases just above the first Treeview row, after rows were trimmed from the top."""
+        if self._lazy_loading or self._lazy_start <= 0:
+            return
+        self._lazy_loading = True
+        try:
+            if self._lazy_sort_ids is not None:
+                page_ids = self._lazy_sort_ids[max(self._lazy_start - self.LAZY_PAGE_SIZE, 0):self._lazy_start]
+                rows = get_case_rows_by_ids_db(self._lazy_page_columns(), page_ids)
+            else:
+                rows = get_cases_page_db(self._lazy_page_columns(), self._lazy_filter, None, self.LAZY_PAGE_SIZE, before_id=self._lazy_first_id)
+            if len(rows) < self.LAZY_PAGE_SIZE:
+                self._lazy_start = len(rows) # Rows were deleted since they were shown; this reaches the top
+            if not rows:
+                return
+            first_visible = int(self.tree.yview()[0] * len(self.tree.get_children()))
+            self._bulk_insert_rows(rows, 0)
+            self._lazy_start -= len(rows)
+            self._lazy_first_id = rows[0][self.tree["columns"].index('id')]
+            self._trim_lazy_rows(from_top=False)
+            # Keep showing the rows that were on screen before the prepend
+            self.tree.yview_moveto((first_visible + len(rows)) / len(self.tree.get_children()))
+        finally:
+            self._lazy_loading = False
 
     def on_treeview_scroll(self, *args):
-        """Callback for Treeview vertical scroll. Loads more data if near bottom."""
+        """Callback for Treeview vertical scroll. Loads more data near either end of the loaded window.
+        The view moves at once; the paging check runs once per idle frame however many events arrive."""
         self.tree.yview(*args)
-        # Check if near bottom
-        if self.tree.yview()[1] > 0.95 and self._lazy_offset < self._lazy_total:
+        if not self._scroll_check_pending:
+            self._scroll_check_pending = True
+            self.root.after_idle(self._check_lazy_paging)
+
+    def on_treeview_mousewheel(self, event):
+        """Scrolls the Treeview by wheel notches (delta is 120 per notch on Windows)."""
+        self.on_treeview_scroll("scroll", int(-1*(event.delta/120)), "units")
+        return "break" # The Treeview class binding would scroll a second time
+
+    def _check_lazy_paging(self):
+        """Loads the next or previous page if the view is near either end of the loaded rows."""
+        self._scroll_check_pending = False
+        top, bottom = self.tree.yview()
+        if bottom > 0.95 and self._lazy_offset < self._lazy_total:
             self.load_next_lazy_page()
+        elif top < 0.05 and self._lazy_start > 0:
+            self.load_previous_lazy_page()
     def show_total_case_summary(self):
         """Show dialog for total case summary options and generate a summary report."""
-        import tkinter as tk
-        from tkinter import Toplevel, Label, Button, StringVar, IntVar, Checkbutton
-        from datetime import datetime, timedelta
         win = Toplevel(self.root)
         win.title("Total Case Summary Options")
         win.grab_set()
@@ -714,38 +1827,22 @@ class CaseLogApp:
             # Parse date range
             start_date = start_var.get().strip()
             end_date = end_var.get().strip()
-            cases = get_all_cases_db()
-            filtered = []
-            for c in cases:
-                created = c.get('created_at') or c.get('start_date')
-                if created:
-                    try:
-                        dt = datetime.strptime(str(created)[:10], '%Y-%m-%d')
-                    except Exception:
-                        continue
-                    if start_date:
-                        try:
-                            sd = datetime.strptime(start_date, '%Y-%m-%d')
-                            if dt < sd:
-                                continue
-                        except Exception:
-                            pass
-                    if end_date:
-                        try:
-                            ed = datetime.strptime(end_date, '%Y-%m-%d')
-                            if dt > ed:
-                                continue
-                        except Exception:
-                            pass
-                    filtered.append(c)
+            # Ignore bounds that are not valid YYYY-MM-DD dates
+            def valid_date(value):
+                try:
+                    datetime.strptime(value, '%Y-%m-%d')
+                    return value
+                except ValueError:
+                    return None
             # Recent activity filter
+            recent_cutoff = None
             if recent_var.get():
                 try:
                     days = int(recent_days_var.get())
-                    cutoff = datetime.now() - timedelta(days=days)
-                    filtered = [c for c in filtered if c.get('created_at') and datetime.strptime(str(c['created_at'])[:10], '%Y-%m-%d') >= cutoff]
-                except Exception:
+                    recent_cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+                except ValueError:
                     pass
+            filtered = get_cases_in_date_range_db(valid_date(start_date), valid_date(end_date), recent_cutoff)
             if not filtered:
                 Messagebox.show_info("Summary", "No cases found for the selected range/criteria.")
                 return
@@ -757,12 +1854,6 @@ class CaseLogApp:
         Button(win, text="Generate Summary", command=do_summary).grid(row=4, column=0, columnspan=3, pady=15)
 
     def export_total_case_summary_pdf(self, cases, start_date, end_date, recent_only, recent_days):
-        from tkinter import filedialog
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib import colors
-        from reportlab.lib.units import inch
         filename = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files", "*.pdf")], title="Save Total Summary PDF")
         if not filename:
             return
@@ -782,10 +1873,11 @@ class CaseLogApp:
         elements.append(Spacer(1, 12))
         # Logo and title (top right)
         try:
-            if os.path.exists(LOGO_FILENAME):
+            logo_reader = get_logo_reader()
+            if logo_reader:
                 logo_width = 1.1*inch
                 logo_height = 1.1*inch
-                img = RLImage(LOGO_FILENAME, width=logo_width, height=logo_height)
+                img = ReportLabImage(logo_reader, width=logo_width, height=logo_height)
                 title = "Total Case Summary"
                 if start_date or end_date:
                     title += f" ({start_date or '...'} to {end_date or '...'})"
@@ -825,7 +1917,7 @@ class CaseLogApp:
             elements.append(Spacer(1, 12))
         # Totals
         total_cases = len(cases)
-        total_gb = sum(float(c.get('volume_size_gb') or 0) for c in cases)
+        total_gb, breakdowns = summarize_cases(cases)
         total_tb = total_gb / 1024 if total_gb > 999 else None
         elements.append(Paragraph(f"<b>Total Cases:</b> {total_cases}", styles["Normal"]))
         if total_tb:
@@ -833,15 +1925,8 @@ class CaseLogApp:
         else:
             elements.append(Paragraph(f"<b>Total Volume:</b> {total_gb:.2f} GB", styles["Normal"]))
         # Breakdown by fields
-        def breakdown(field):
-            d = {}
-            for c in cases:
-                v = (c.get(field) or '').strip()
-                if v:
-                    d[v] = d.get(v, 0) + 1
-            return sorted(d.items(), key=lambda x: x[1], reverse=True)
-        for field, label in [("examiner", "Examiner"), ("agency", "Agency"), ("offense_type", "Offense Type"), ("device_type", "Device Type")]:
-            items = breakdown(field)
+        for field, label in SUMMARY_BREAKDOWN_FIELDS:
+            items = breakdowns[field]
             if items:
                 elements.append(Spacer(1, 8))
                 elements.append(Paragraph(f"<b>{label} Breakdown:</b>", styles["Normal"]))
@@ -854,8 +1939,8 @@ class CaseLogApp:
                     ("GRID", (0,0), (-1,-1), 0.5, colors.grey),
                 ]))
                 elements.append(t)
-        # List of recent cases
-        if recent_only:
+        # List of recent cases (skipped when there are none)
+        if recent_only and cases:
             elements.append(Spacer(1, 12))
             elements.append(Paragraph(f"<b>Recent Cases (last {recent_days} days):</b>", styles["Normal"]))
             case_rows = []
@@ -882,57 +1967,35 @@ class CaseLogApp:
         Messagebox.show_info("Summary", f"Total case summary PDF saved to:\n{filename}")
 
     def export_total_case_summary_xlsx(self, cases, start_date, end_date, recent_only, recent_days):
-        from tkinter import filedialog
-        import pandas as pd
         filename = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")], title="Save Total Summary Excel")
         if not filename:
             return
         # Build summary data
         total_cases = len(cases)
-        total_gb = sum(float(c.get('volume_size_gb') or 0) for c in cases)
+        total_gb, breakdowns = summarize_cases(cases)
         total_tb = total_gb / 1024 if total_gb > 999 else None
-        summary = {
-            "Total Cases": [total_cases],
-            "Total Volume (GB)": [total_gb],
-            "Total Volume (TB)": [total_tb if total_tb else '']
-        }
-        df_summary = pd.DataFrame(summary)
+        sheets = [("Summary", ["Total Cases", "Total Volume (GB)", "Total Volume (TB)"],
+                   [(total_cases, total_gb, total_tb if total_tb else '')])]
         # Breakdown sheets
-        def breakdown(field):
-            d = {}
-            for c in cases:
-                v = (c.get(field) or '').strip()
-                if v:
-                    d[v] = d.get(v, 0) + 1
-            return sorted(d.items(), key=lambda x: x[1], reverse=True)
-        with pd.ExcelWriter(filename) as writer:
-            df_summary.to_excel(writer, sheet_name="Summary", index=False)
-            for field, label in [("examiner", "Examiner"), ("agency", "Agency"), ("offense_type", "Offense Type"), ("device_type", "Device Type")]:
-                items = breakdown(field)
-                if items:
-                    df = pd.DataFrame(items, columns=[label, "Count"])
-                    df.to_excel(writer, sheet_name=label, index=False)
-            # Recent cases sheet
-            if recent_only:
-                rows = []
-                for c in cases:
-                    rows.append({
-                        "Case #": c.get('case_number', ''),
-                        "Created": format_date_str_for_display(c.get('created_at', '')),
-                        "Examiner": c.get('examiner', ''),
-                        "Offense": c.get('offense_type', ''),
-                        "Vol (GB)": c.get('volume_size_gb', '')
-                    })
-                df_recent = pd.DataFrame(rows)
-                df_recent.to_excel(writer, sheet_name=f"Recent_{recent_days}d", index=False)
+        for field, label in SUMMARY_BREAKDOWN_FIELDS:
+            items = breakdowns[field]
+            if items:
+                sheets.append((label, [label, "Count"], items))
+        # Recent cases sheet (skipped when there are none)
+        if recent_only and cases:
+            sheets.append((f"Recent_{recent_days}d", ["Case #", "Created", "Examiner", "Offense", "Vol (GB)"],
+                           ((c.get('case_number', ''), format_date_str_for_display(c.get('created_at', '')),
+                             c.get('examiner', ''), c.get('offense_type', ''), c.get('volume_size_gb', ''))
+                            for c in cases)))
+        # Rows are written in order, one whole row at a time
+        write_xlsx_sheets(filename, sheets)
         Messagebox.show_info("Summary", f"Total case summary Excel saved to:\n{filename}")
     def show_case_summary_report(self):
         """Generate a one-page PDF summary for the selected case."""
-        from tkinter import filedialog
         if not self.tree.selection() or len(self.tree.selection()) != 1:
             Messagebox.show_info("Case Summary", "Please select exactly one case in the table.")
             return
-        selected_id = self.tree.item(self.tree.selection()[0])['values'][0]
+        selected_id = self._tree_row_values(self.tree.selection()[0])[0]
         case = get_case_by_id_db(selected_id)
         if not case:
             Messagebox.show_error("Case Summary", "Could not retrieve case details.")
@@ -942,20 +2005,16 @@ class CaseLogApp:
         if not filename:
             return
         # Build PDF
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib import colors
-        from reportlab.lib.units import inch
         doc = SimpleDocTemplate(filename, pagesize=letter)
         elements = []
         styles = getSampleStyleSheet()
         # Logo at top right if available
         try:
-            if os.path.exists(LOGO_FILENAME):
+            logo_reader = get_logo_reader()
+            if logo_reader:
                 logo_width = 1.1*inch
                 logo_height = 1.1*inch
-                img = RLImage(LOGO_FILENAME, width=logo_width, height=logo_height)
+                img = ReportLabImage(logo_reader, width=logo_width, height=logo_height)
                 title_para = Paragraph(f"<b>Case Summary Report</b>", styles["Title"])
                 logo_table = Table(
                     [[title_para, img]],
@@ -1004,10 +2063,8 @@ class CaseLogApp:
         Messagebox.show_info("Case Summary", f"Case summary PDF saved to:\n{filename}")
     def show_custom_report_builder(self):
         """Show a dialog for building a custom report from selected columns and export as PDF/XLSX."""
-        import tkinter as tk
-        from tkinter import Toplevel, Checkbutton, IntVar, Button, Label, StringVar, Radiobutton
-        all_columns = [k for k in self.tree_columns_config.keys() if k != 'id']
-        col_labels = {k: self.tree_columns_config[k]['text'] for k in all_columns}
+        all_columns = self._non_id_columns
+        col_labels = self._col_labels
         # Default: use currently visible columns
         default_cols = set(self.get_visible_treeview_columns())
         win = Toplevel(self.root)
@@ -1040,24 +2097,12 @@ class CaseLogApp:
             if filter_var.get() == "all":
                 cases = get_all_cases_db()
             elif filter_var.get() == "filtered":
-                cases = getattr(self, '_last_filtered_cases', get_all_cases_db())
+                # Same SQL/FTS filter the View Data tab pages with; only matching rows are fetched
+                cases = search_cases_db(self._lazy_filter or "")
             else:  # selected
-                selected_ids = [self.tree.item(i)['values'][0] for i in self.tree.selection()]
-                all_cases = get_all_cases_db()
-                cases = [c for c in all_cases if c.get('id') in selected_ids]
-            # Build rows
-            rows = []
-            for case in cases:
-                row = []
-                for col in selected_cols:
-                    val = case.get(col, "")
-                    # Format for display if needed
-                    if col in ('start_date', 'end_date', 'created_at'):
-                        val = format_date_str_for_display(val)
-                    elif col in ('fpr_complete',):
-                        val = format_bool_int(val)
-                    row.append(val)
-                rows.append(row)
+                selected_ids = {self._tree_row_values(i)[0] for i in self.tree.selection()}
+                cases = get_cases_by_ids_db(selected_ids)
+            rows = self._report_rows(cases, selected_cols)
             # Header row
             headers = [col_labels[c] for c in selected_cols]
             if fmt_var.get() == "PDF":
@@ -1069,12 +2114,6 @@ class CaseLogApp:
         btn.grid(row=len(all_columns)+8, column=0, pady=15)
 
     def export_custom_report_pdf(self, headers, rows):
-        from tkinter import filedialog
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.lib.pagesizes import letter, landscape
-        from reportlab.lib import colors
-        from datetime import datetime
         # Prompt for header info if not set
         info = self.get_report_header_info()
         if not any(info.values()):
@@ -1083,10 +2122,19 @@ class CaseLogApp:
         filename = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files", "*.pdf")], title="Save PDF Report")
         if not filename:
             return
+        header_widths = {config["text"]: config["width"] for config in self.tree_columns_config.values()}
+        weights = [header_widths.get(h) or 100 for h in headers]
+        self._run_report_export("PDF", filename, self._write_custom_report_pdf, filename, headers, rows, info, weights)
+
+    def _write_custom_report_pdf(self, filename, headers, rows, info, weights):
+        """Builds the custom PDF report (runs on the export thread; no Tk calls)."""
         doc = SimpleDocTemplate(filename, pagesize=landscape(letter))
         style = getSampleStyleSheet()["Normal"]
-        data = [headers] + rows
-        table = Table(data, repeatRows=1)
+        data = [headers] + pdf_table_cells(rows, 9)
+        # Fixed column widths (from the Treeview widths, scaled to the page) let LongTable
+        # lay out page by page instead of measuring every cell first; cell text wraps to fit
+        col_widths = [doc.width * w / sum(weights) for w in weights] if headers else None
+        table = LongTable(data, repeatRows=1, colWidths=col_widths)
         table.setStyle(TableStyle([
             ("BACKGROUND", (0,0), (-1,0), colors.lightgrey),
             ("TEXTCOLOR", (0,0), (-1,0), colors.black),
@@ -1097,8 +2145,8 @@ class CaseLogApp:
             ("GRID", (0,0), (-1,-1), 0.5, colors.grey),
         ]))
         elements = []
-        # Header info at top right
-        header_info = self.get_report_header_info()
+        # Header info at top right (read on the Tk thread before the export started)
+        header_info = info
         now_str = datetime.now().strftime('%Y-%m-%d')
         header_lines = [
             f"Name: {header_info.get('Name','')}",
@@ -1111,22 +2159,19 @@ class CaseLogApp:
         elements.append(Spacer(1, 12))
         # Logo at top right if available
         try:
-            if os.path.exists(LOGO_FILENAME):
+            logo_reader = get_logo_reader()
+            if logo_reader:
                 logo_width = 1.1*inch
                 logo_height = 1.1*inch
-                img = RLImage(LOGO_FILENAME, width=logo_width, height=logo_height)
+                img = ReportLabImage(logo_reader, width=logo_width, height=logo_height)
                 elements.append(img)
                 elements.append(Spacer(1, 12))
         except Exception:
             pass
         elements.append(table)
         doc.build(elements)
-        Messagebox.show_info("Report Exported", f"Custom PDF report saved to:\n{filename}")
 
     def export_custom_report_xlsx(self, headers, rows):
-        from tkinter import filedialog
-        import pandas as pd
-        from datetime import datetime
         # Prompt for header info if not set
         info = self.get_report_header_info()
         if not any(info.values()):
@@ -1135,9 +2180,12 @@ class CaseLogApp:
         filename = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")], title="Save Excel Report")
         if not filename:
             return
-        df = pd.DataFrame(rows, columns=headers)
-        # Add header info as a separate sheet
-        header_info = self.get_report_header_info()
+        self._run_report_export("Excel", filename, self._write_custom_report_xlsx, filename, headers, rows, info)
+
+    def _write_custom_report_xlsx(self, filename, headers, rows, info):
+        """Writes the custom Excel report (runs on the export thread; no Tk calls)."""
+        # Add header info as a separate sheet (read on the Tk thread before the export started)
+        header_info = info
         now_str = datetime.now().strftime('%Y-%m-%d')
         header_dict = {
             'Name': header_info.get('Name',''),
@@ -1145,22 +2193,42 @@ class CaseLogApp:
             'Division': header_info.get('Division',''),
             'Date': now_str
         }
-        with pd.ExcelWriter(filename) as writer:
-            df.to_excel(writer, index=False, sheet_name='Report Data')
-            import pandas as pd
-            pd.DataFrame([header_dict]).to_excel(writer, index=False, sheet_name='Header Info')
-        Messagebox.show_info("Report Exported", f"Custom Excel report saved to:\n{filename}")
+        write_xlsx_sheets(filename, [
+            ('Report Data', headers, rows),
+            ('Header Info', list(header_dict), [list(header_dict.values())]),
+        ])
+
+    def _run_report_export(self, kind, filename, write, *args):
+        """Runs write(*args) on a background thread so a large report doesn't freeze the window,
+        then reports the result on the Tk thread. rows passed in must already be a snapshot."""
+        self.update_status(f"Exporting {kind} report...")
+        def done(error=None):
+            if error:
+                Messagebox.show_error("Export Error", f"Failed to export {kind} report:\n{error}")
+                self.update_status(f"{kind} report export failed.")
+            else:
+                Messagebox.show_info("Report Exported", f"Custom {kind} report saved to:\n{filename}")
+                self.update_status(f"{kind} report exported.")
+        def worker():
+            try:
+                write(*args)
+            except Exception as e:
+                logging.error(f"Error exporting {kind} report to '{filename}': {e}")
+                self.root.after(0, done, str(e))
+                return
+            self.root.after(0, done)
+        threading.Thread(target=worker, name="report-export", daemon=True).start()
     def show_report_header_info_settings(self):
         self.prompt_report_header_info()
     def get_visible_treeview_columns(self):
         """Return the list of visible columns for the Treeview, based on user preferences."""
         # Always hide 'id'
-        all_columns = [key for key in self.tree_columns_config.keys() if key != 'id']
+        all_columns = self._non_id_columns
         visible = get_user_pref('treeview_columns')
         if visible and isinstance(visible, list):
             # Only show columns that still exist
             return [col for col in visible if col in all_columns]
-        return all_columns
+        return list(all_columns)
 
     def set_visible_treeview_columns(self, columns):
         """Save the list of visible columns for the Treeview."""
@@ -1169,10 +2237,8 @@ class CaseLogApp:
 
     def show_column_selector(self):
         """Show a dialog to let the user select which columns are visible in the View Data tab."""
-        import tkinter as tk
-        from tkinter import Toplevel, Checkbutton, IntVar, Button, Label
         # Get all columns except 'id'
-        all_columns = [k for k in self.tree_columns_config.keys() if k != 'id']
+        all_columns = self._non_id_columns
         current = set(self.get_visible_treeview_columns())
         win = Toplevel(self.root)
         win.title("Select Columns to Display")
@@ -1186,7 +2252,7 @@ class CaseLogApp:
         vars = {}
         for i, col in enumerate(all_columns):
             var = IntVar(value=1 if col in current else 0)
-            cb = Checkbutton(content, text=self.tree_columns_config[col]['text'], variable=var)
+            cb = Checkbutton(content, text=self._col_labels[col], variable=var)
             cb.grid(row=i, column=0, sticky='w', padx=5, pady=2)
             vars[col] = var
         def apply():
@@ -1206,9 +2272,10 @@ class CaseLogApp:
         self._view_edit_undo_stack = []
         self._view_edit_redo_stack = []
 
-    def push_view_edit_history(self, old_data, new_data):
-        """Pushes an edit action to the undo stack and clears the redo stack."""
-        self._view_edit_undo_stack.append((old_data, new_data))
+    def push_view_edit_history(self, case_id, changes):
+        """Pushes an edit action to the undo stack and clears the redo stack.
+        changes maps each edited column to its (old_value, new_value) pair."""
+        self._view_edit_undo_stack.append((case_id, changes))
         self._view_edit_redo_stack.clear()
 
     def undo_view_edit(self):
@@ -1216,13 +2283,12 @@ class CaseLogApp:
         if not hasattr(self, '_view_edit_undo_stack') or not self._view_edit_undo_stack:
             Messagebox.show_info("Undo", "Nothing to undo.")
             return
-        old_data, new_data = self._view_edit_undo_stack.pop()
+        case_id, changes = self._view_edit_undo_stack.pop()
         # Save redo info
-        self._view_edit_redo_stack.append((old_data, new_data))
-        # Restore old data in DB
-        if old_data and 'id' in old_data:
-            update_case_db(old_data['id'], old_data)
-            self.refresh_data_view()
+        self._view_edit_redo_stack.append((case_id, changes))
+        # Restore only the edited columns in DB
+        if update_case_fields_db(case_id, {field: old for field, (old, new) in changes.items()}):
+            self._schedule_full_refresh()
             self.update_status("Undo: Edit reverted.")
         else:
             self.update_status("Undo failed: No valid data.")
@@ -1232,278 +2298,164 @@ class CaseLogApp:
         if not hasattr(self, '_view_edit_redo_stack') or not self._view_edit_redo_stack:
             Messagebox.show_info("Redo", "Nothing to redo.")
             return
-        old_data, new_data = self._view_edit_redo_stack.pop()
+        case_id, changes = self._view_edit_redo_stack.pop()
         # Save undo info
-        self._view_edit_undo_stack.append((old_data, new_data))
-        # Re-apply new data in DB
-        if new_data and 'id' in new_data:
-            update_case_db(new_data['id'], new_data)
-            self.refresh_data_view()
+        self._view_edit_undo_stack.append((case_id, changes))
+        # Re-apply only the edited columns in DB
+        if update_case_fields_db(case_id, {field: new for field, (old, new) in changes.items()}):
+            self._schedule_full_refresh()
             self.update_status("Redo: Edit re-applied.")
         else:
             self.update_status("Redo failed: No valid data.")
 
-    def load_map_markers(self):
-        """Load map markers for each unique city/state in the case log, showing offenses on click. Async geocoding for uncached locations."""
-        import threading
+    def load_map_markers(self, force=False):
+        """Load map markers for each unique city/state in the case log, showing offenses on click. Async geocoding for uncached locations.
+        Does nothing if the cases haven't changed since the last load, unless force is set (e.g. a new marker icon).
+        Only markers for locations that appeared or disappeared are touched; force rebuilds them all."""
         if not self.map_widget:
-            if self.map_status_label:
-                self.map_status_label.config(text="Map status: Map widget not available")
+            self._set_map_status("Map status: Map widget not available")
             return
-        if hasattr(self.map_widget, 'delete_all_markers'):
-            self.map_widget.delete_all_markers()
-        cases = get_all_cases_db()
-        # Group cases by (city, state)
-        grouped = {}
-        for case in cases:
-            city = (case.get('city_of_offense') or '').strip()
-            state = (case.get('state_of_offense') or '').strip()
-            if not city or not state:
-                continue
-            key = (city, state)
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(case)
-        logging.info(f"[MapMarkers] Found {len(grouped)} unique city/state locations.")
-        self.map_markers = {}
-        self._grouped_cases_by_location = grouped
-        # Prepare geocoding queue for uncached locations
-        self.geocoding_queue = queue.Queue()
+        if not force and self._markers_version == _cases_version:
+            return
+        self._markers_version = _cases_version
+        if force:
+            if hasattr(self.map_widget, 'delete_all_markers'):
+                self.map_widget.delete_all_markers()
+            self.map_markers = {}
+        # Locations and their offense types, grouped in SQL
+        offenses_by_location = get_offenses_by_location_db()
+        logging.info(f"[MapMarkers] Found {len(offenses_by_location)} unique city/state locations.")
+        # Remove markers for locations no longer in the log; the rest stay on the canvas
+        for location in [key for key in self.map_markers if key not in offenses_by_location]:
+            try:
+                self.map_markers.pop(location).delete()
+            except Exception as e:
+                logging.error(f"[MapMarkers] Failed to remove marker for {location[0]}, {location[1]}: {e}")
+        # Marker popup text is built once per location here, not on every placement or click
+        self._marker_message_by_location = {
+            key: "Offense Types:\n" + ("\n".join(f"• {offense}" for offense in offenses) or "No offenses recorded")
+            for key, offenses in offenses_by_location.items()
+        }
+        # Collect uncached locations for geocoding; lookups hit the in-memory geocache
         self._pending_marker_locations = []
-        for (city, state) in grouped:
-            location_key = f"{city}|{state}"
-            coords = get_cached_location_db(location_key)
+        for (city, state) in offenses_by_location:
+            if (city, state) in self.map_markers:
+                continue # Already on the map; its popup text was refreshed above
+            coords = get_cached_location(f"{city}|{state}")
             if coords:
                 # Place marker immediately
                 self._place_map_marker(city, state, coords)
             else:
                 self._pending_marker_locations.append((city, state))
-                self.geocoding_queue.put((city, state))
-        if self.map_status_label:
-            self.map_status_label.config(text=f"Map status: {len(self.map_markers)} cached, {len(self._pending_marker_locations)} to geocode")
-        # Start geocoding thread if needed
+        self._set_map_status(f"Map status: {len(self.map_markers)} cached, {len(self._pending_marker_locations)} to geocode")
+        # Drop requests still waiting from a previous load; they are resubmitted below if still needed
+        for future in self._geocode_futures:
+            future.cancel()
+        # Geocode on a small pool; the shared RateLimiter keeps the request rate at 1/s
         if self._pending_marker_locations:
-            if not hasattr(self, 'geocoding_thread') or self.geocoding_thread is None or not self.geocoding_thread.is_alive():
-                self.geocoding_thread = threading.Thread(target=self._geocode_locations_worker, daemon=True)
-                self.geocoding_thread.start()
-                self.processing_queue = True
-                self._geocoding_after_id = self.root.after(500, self._process_geocoding_results)
-            else:
-                self.processing_queue = True
-                self._geocoding_after_id = self.root.after(500, self._process_geocoding_results)
+            executor = ThreadPoolExecutor(max_workers=get_geocode_workers(), thread_name_prefix="geocode")
+            self._geocode_futures = [
+                executor.submit(self._geocode_location, city, state)
+                for city, state in self._pending_marker_locations
+            ]
+            # Each finished request wakes the UI thread; there is no polling timer
+            for future in self._geocode_futures:
+                future.add_done_callback(self._notify_geocode_done)
+            executor.shutdown(wait=False) # Worker threads exit once the submitted work is done
         else:
-            self.processing_queue = False
-            if self.map_status_label:
-                self.map_status_label.config(text=f"Map status: {len(self.map_markers)} locations loaded (all cached)")
+            self._geocode_futures = []
+            self._set_map_status(f"Map status: {len(self.map_markers)} locations loaded (all cached)")
 
     def _place_map_marker(self, city, state, coords):
         """Helper to place a marker on the map for a city/state with given coords."""
+        if (city, state) in self.map_markers:
+            return # One marker per location; late results from an earlier load would only stack duplicates
+        if (city, state) not in self._marker_message_by_location:
+            return # Late result for a location whose cases have since been deleted
         try:
             lat, lon = coords
-            city_cases = self._grouped_cases_by_location.get((city, state), [])
-            offenses = sorted(set((c.get('offense_type') or '').strip() for c in city_cases if c.get('offense_type')))
-            offense_str = ', '.join(offenses) if offenses else 'No offenses recorded'
-            info_text = f"{city}, {state}\nOffense Types: {offense_str}"
             marker_icon = getattr(self, 'marker_icon_tk_map', None)
             marker = self.map_widget.set_marker(
                 lat, lon,
                 text="",
                 icon=marker_icon if marker_icon else DEFAULT_MARKER_ICON,
-                command=lambda marker, info=info_text: self.on_marker_click(info)
+                command=lambda marker, location=(city, state): self.on_marker_click(location)
             )
             self.map_markers[(city, state)] = marker
             logging.info(f"[MapMarkers] Marker set for {city}, {state} at ({lat}, {lon})")
         except Exception as e:
             logging.error(f"[MapMarkers] Failed to set marker for {city}, {state}: {e}")
 
-    def _geocode_locations_worker(self):
-        """Background thread: geocode locations from the queue and store results in a thread-safe list."""
-        from geopy.geocoders import Nominatim
-        import time
-        geolocator = Nominatim(user_agent=APP_NAME)
-        self._geocoded_results = []
-        while not self.geocoding_queue.empty():
-            try:
-                city, state = self.geocoding_queue.get_nowait()
-            except Exception:
-                break
-            try:
-                location = geolocator.geocode(f"{city}, {state}, USA", timeout=10)
-                if location:
-                    coords = (location.latitude, location.longitude)
-                    add_cached_location_db(f"{city}|{state}", location.latitude, location.longitude)
-                    self._geocoded_results.append((city, state, coords))
-                    logging.info(f"[MapMarkers] Geocoded {city}, {state}: {coords}")
-                else:
-                    logging.warning(f"[MapMarkers] Geocode failed for {city}, {state}")
-            except Exception as e:
-                logging.warning(f"[MapMarkers] Geocode error for {city}, {state}: {e}")
-            time.sleep(1.0)  # Be nice to Nominatim
-
-    def _process_geocoding_results(self):
-        """Process geocoded results from the background thread and place markers on the map."""
-        if hasattr(self, '_geocoded_results') and self._geocoded_results:
-            for city, state, coords in self._geocoded_results:
-                self._place_map_marker(city, state, coords)
-            self._geocoded_results.clear()
-            if self.map_status_label:
-                self.map_status_label.config(text=f"Map status: {len(self.map_markers)} locations loaded (with geocoding)")
-        # Continue polling if thread is alive and queue not empty
-        if hasattr(self, 'geocoding_thread') and self.geocoding_thread and self.geocoding_thread.is_alive():
-            self._geocoding_after_id = self.root.after(500, self._process_geocoding_results)
-        else:
-            self.processing_queue = False
-            if self.map_status_label:
-                self.map_status_label.config(text=f"Map status: {len(self.map_markers)} locations loaded (all done)")
-    def import_cases_from_xlsx(self):
-        """Import cases from an XLSX file exported by this or previous versions. Imports ALL rows, regardless of duplicate or missing fields. Ensures DB is initialized before import."""
-        import pandas as pd
-        # Ensure database and tables exist before import
+    def _geocode_location(self, city, state):
+        """Pool worker: geocode one location and queue the result for the UI thread,
+        which also writes it to the geocache (batched per poll)."""
+        if self._shutdown.is_set():
+            return # Closing: don't start another rate-limited request
         try:
-            init_db()
+            # A request left over from an earlier load may already have cached this location;
+            # only the network path waits on the rate limiter
+            coords = get_cached_location(f"{city}|{state}")
+            if coords:
+                self._geocoded_results.put((city, state, coords, True))
+                return
+            location = get_geocoder()(f"{city}, {state}, USA") # Rate limited to one request per second
+            if location:
+                coords = (location.latitude, location.longitude)
+                self._geocoded_results.put((city, state, coords, False))
+                logging.info(f"[MapMarkers] Geocoded {city}, {state}: {coords}")
+            else:
+                logging.warning(f"[MapMarkers] Geocode failed for {city}, {state}")
         except Exception as e:
-            logging.error(f"Failed to initialize database before import: {e}")
-            Messagebox.show_error("Database Error", f"Failed to initialize database: {e}")
-            return
-
-        filename = filedialog.askopenfilename(
-            filetypes=[("Excel files", "*.xlsx")],
-            title="Select Excel File to Import"
-        )
-        if not filename:
-            return
+            logging.warning(f"[MapMarkers] Geocode error for {city}, {state}: {e}")
 
-        try:
-            self.update_status("Importing cases from XLSX...")
-            df = pd.read_excel(filename)
-            expected_headers = [
-                "ID", "Case #", "Examiner", "Investigator", "Agency", "City", "State",
-                "Start (MM-DD-YYYY)", "End (MM-DD-YYYY)", "Vol (GB)", "Offense", "Device", "Model", "OS",
-                "Recovered?", "FPR?", "Notes", "Created (YYYY-MM-DD)"
-            ]
-            df.columns = [str(col).strip() for col in df.columns]
-            header_map = {h.lower(): h for h in df.columns}
-            for h in expected_headers:
-                if h not in df.columns:
-                    Messagebox.show_error("Import Error", f"Missing required column: {h}")
-                    self.update_status(f"Import failed: missing column {h}")
-                    return
+    def geocoding_in_progress(self):
+        """Returns True while any submitted geocoding request is still pending or running."""
+        return any(not future.done() for future in self._geocode_futures)
 
-            imported_count = 0
-            failed_count = 0
-            for idx, row in df.iterrows():
-                case_data = {
-                    "case_number": str(row.get("Case #", "")).strip() if not pd.isnull(row.get("Case #", "")) else None,
-                    "examiner": str(row.get("Examiner", "")).strip() if not pd.isnull(row.get("Examiner", "")) else None,
-                    "investigator": str(row.get("Investigator", "")).strip() if not pd.isnull(row.get("Investigator", "")) else None,
-                    "agency": str(row.get("Agency", "")).strip() if not pd.isnull(row.get("Agency", "")) else None,
-                    "city_of_offense": str(row.get("City", "")).strip() if not pd.isnull(row.get("City", "")) else None,
-                    "state_of_offense": str(row.get("State", "")).strip() if not pd.isnull(row.get("State", "")) else None,
-                    "start_date": None,
-                    "end_date": None,
-                    "volume_size_gb": None,
-                    "offense_type": str(row.get("Offense", "")).strip() if not pd.isnull(row.get("Offense", "")) else None,
-                    "device_type": str(row.get("Device", "")).strip() if not pd.isnull(row.get("Device", "")) else None,
-                    "model": str(row.get("Model", "")).strip() if not pd.isnull(row.get("Model", "")) else None,
-                    "os": str(row.get("OS", "")).strip() if not pd.isnull(row.get("OS", "")) else None,
-                    "data_recovered": None,
-                    "fpr_complete": None,
-                    "notes": str(row.get("Notes", "")).strip() if not pd.isnull(row.get("Notes", "")) else None,
-                }
-                # Parse dates
-                try:
-                    sd = str(row.get("Start (MM-DD-YYYY)", "")).strip()
-                    if sd:
-                        case_data["start_date"] = datetime.strptime(sd, "%m-%d-%Y").strftime("%Y-%m-%d")
-                except Exception:
-                    case_data["start_date"] = None
-                try:
-                    ed = str(row.get("End (MM-DD-YYYY)", "")).strip()
-                    if ed:
-                        case_data["end_date"] = datetime.strptime(ed, "%m-%d-%Y").strftime("%Y-%m-%d")
-                except Exception:
-                    case_data["end_date"] = None
-                # Parse volume size
-                try:
-                    vs = row.get("Vol (GB)", None)
-                    if pd.notnull(vs):
-                        case_data["volume_size_gb"] = float(vs)
-                except Exception:
-                    case_data["volume_size_gb"] = None
-                # Parse data_recovered (Recovered?)
-                dr = str(row.get("Recovered?", "")).strip().lower() if not pd.isnull(row.get("Recovered?", "")) else ""
-                if dr == "yes":
-                    case_data["data_recovered"] = True
-                elif dr == "no":
-                    case_data["data_recovered"] = False
-                else:
-                    case_data["data_recovered"] = None
-                # Parse fpr_complete (FPR?)
-                fpr = str(row.get("FPR?", "")).strip().lower() if not pd.isnull(row.get("FPR?", "")) else ""
-                if fpr == "yes":
-                    case_data["fpr_complete"] = True
-                elif fpr == "no":
-                    case_data["fpr_complete"] = False
-                else:
-                    case_data["fpr_complete"] = None
-                created_at = str(row.get("Created (YYYY-MM-DD)", "")).strip() if not pd.isnull(row.get("Created (YYYY-MM-DD)", "")) else None
-                if created_at:
-                    case_data["created_at"] = created_at
-                # Add to DB (import all rows, even if case_number is duplicated or empty)
-                success = add_case_db(case_data)
-                if success:
-                    imported_count += 1
-                else:
-                    failed_count += 1
-                    logging.warning(f"Row {idx+1} failed to add: {case_data}")
-            Messagebox.show_info("Import Complete", f"Imported {imported_count} rows from XLSX. {failed_count} failed.")
-            self.refresh_data_view()
-            self.load_map_markers()
-            self.populate_graph_filters()
-            self.update_status(f"Imported {imported_count} rows from XLSX. {failed_count} failed.")
-        except Exception as e:
-            logging.error(f"Error importing cases from XLSX: {e}")
-            Messagebox.show_error("Import Error", f"Failed to import cases: {e}")
-            self.update_status("Import failed.")
-    def on_closing(self):
-        """Safely handle application shutdown, canceling background tasks and scheduled callbacks, and ensuring map widget is destroyed to prevent background errors."""
-        # Cancel any scheduled .after() callbacks
-        try:
-            if hasattr(self, '_geocoding_after_id') and self._geocoding_after_id:
-                try:
-                    self.root.after_cancel(self._geocoding_after_id)
-                    self._geocoding_after_id = None
-                except Exception as e:
-                    logging.warning(f"Error cancelling scheduled after callback: {e}")
-        except Exception as e:
-            logging.warning(f"Error during after_cancel cleanup: {e}")
-
-        # Always destroy the map widget if it exists, to prevent background update errors
+    def _drain_geocoded_results(self):
+        """Takes every queued geocoding result and writes the newly geocoded ones to the
+        geocache in one transaction. Returns the (city, state, coords, from_cache) tuples."""
+        results = []
+        while True:
+            try:
+                results.append(self._geocoded_results.get_nowait())
+            except queue.Empty:
+                break
+        new_locations = [(f"{city}|{state}", lat, lon) for city, state, (lat, lon), from_cache in results if not from_cache]
+        if new_locations:
+            add_cached_locations_db(new_locations)
+        return results
+
+    def _notify_geocode_done(self, future):
+        """Future callback, run on the worker thread: posts <<GeocodeResult>> to the Tk loop.
+        Notifications are coalesced until _process_geocoding_results picks them up."""
+        if self._shutdown.is_set() or self._geocode_event_pending.is_set():
+            return
+        self._geocode_event_pending.set()
         try:
-            if hasattr(self, 'map_widget') and self.map_widget is not None:
-                try:
-                    # tkintermapview provides a method to destroy/cleanup, if available
-                    if hasattr(self.map_widget, 'destroy'):
-                        self.map_widget.destroy()
-                except Exception as e:
-                    logging.warning(f"Error destroying map widget: {e}")
-                finally:
-                    self.map_widget = None
-        except Exception as e:
-            logging.warning(f"Error during map widget cleanup: {e}")
+            self.root.event_generate("<<GeocodeResult>>", when="tail")
+        except (RuntimeError, tk.TclError):
+            pass # Window already closed
+
+    def _process_geocoding_results(self, event=None):
+        """Handles <<GeocodeResult>>: places markers for every geocoded result queued so far."""
+        self._geocode_event_pending.clear() # Later completions must post a new event
+        results = self._drain_geocoded_results()
+        # Place the whole batch, then let Tk repaint the canvas once when idle
+        for city, state, coords, from_cache in results:
+            self._place_map_marker(city, state, coords)
+        if self.geocoding_in_progress():
+            self._set_map_status(f"Map status: {len(self.map_markers)} locations loaded (with geocoding)")
+        else:
+            self._set_map_status(f"Map status: {len(self.map_markers)} locations loaded (all done)")
 
-        # Optionally, set a flag to stop background threads (if you have a custom thread loop)
-        self.processing_queue = False
+    def _set_map_status(self, text):
+        """Shows text in the map status label. Failed or cancelled geocoding requests also
+        trigger updates, so the label is only reconfigured when the text actually changes."""
+        if self.map_status_label and text != self._last_map_status:
+            self._last_map_status = text
+            self.map_status_label.config(text=text)
 
-        # Destroy the main window
-        try:
-            # Prevent further Tkinter events from being processed after destroy
-            if hasattr(self, 'root'):
-                self.root.quit()
-            self.root.destroy()
-            logging.info("Application shutting down.")
-        except Exception as e:
-            logging.error(f"Error during shutdown: {e}")
     def __init__(self, root):
         self.root = root
         self.root.title(APP_NAME)
@@ -1533,6 +2485,10 @@ class CaseLogApp:
 
         # Attributes for entry widgets
         self.entries = {} # Dictionary to hold Tkinter variables/widgets for form fields
+        self.combo_widgets = weakref.WeakValueDictionary() # Combobox widgets by field key, for entries that are StringVars
+        self._field_getters = {} # Field key -> fn(strip) returning the form value, set when the widget is built
+        self._field_clearers = {} # Field key -> fn() resetting the field, set when the widget is built
+        self._field_setters = {} # Field key -> fn(value) loading a stored case value into the field
         self.editing_case_id = None # Variable to track if we are currently editing a case (None or case_id)
         self.submit_button = None # Reference to the submit button for text changes
         self.field_frame_container = None # Reference to the frame holding input fields
@@ -1549,8 +2505,13 @@ class CaseLogApp:
         self.marker_icon_tk_preview = None # Image for settings preview (e.g., 50x50)
         self.marker_icon_preview_canvas = None # Reference to the settings preview canvas
 
-        self.load_logo_image() # Load the logo upon app initialization
-        self.load_marker_icon_image() # Load the marker icon upon app initialization
+        # Decode the logo and marker icon on worker threads while the widgets are built;
+        # _finish_image_loads turns them into Tk images once the widgets exist
+        self._image_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image-load")
+        self._image_loads = [
+            (self._image_pool.submit(cached_image_decode, decode_logo_image, self.logo_path.get()), self._apply_logo_image),
+            (self._image_pool.submit(cached_image_decode, decode_marker_icon_image, MARKER_ICON_FILENAME), self._apply_marker_icon_image),
+        ]
 
 
         # Attributes for Map View
@@ -1559,7 +2520,8 @@ class CaseLogApp:
         # Geopy geolocator instance - only create one per thread. Not needed in main thread.
         # self.geolocator = Nominatim(user_agent=APP_NAME)
         self.map_markers = {} # Dictionary to hold mapview markers with location (city, state) as key
-        self._grouped_cases_by_location = {} # Store cases grouped by location for info bubbles
+        self._markers_version = None # _cases_version the current markers were built from
+        self._marker_message_by_location = {} # Bulleted offense-type list per location, shown on marker click
 
 
         # Attributes for View Data Treeview
@@ -1567,6 +2529,7 @@ class CaseLogApp:
         self.tree_columns_config = {} # Dictionary to store treeview column configuration
         self.treeview_sort_column = None # To keep track of the currently sorted column
         self.treeview_sort_reverse = False # To keep track of the sort order
+        self._view_filter_string = "" # Current search text, stripped and lower-cased once when applied
 
         # Attributes for Graph Tab
         self.fig = None # Matplotlib figure
@@ -1577,15 +2540,22 @@ class CaseLogApp:
         self.status_label = None
         self.status_animation_id = None
         self.status_text = ""
+        self._debounce_ids = {} # Pending after() ids by _debounce key
 
 
         # Attributes for threading and queue for map loading
-        self.geocoding_queue = queue.Queue()
-        self.geocoding_thread = None
-        self.processing_queue = False # Flag to indicate if we are currently checking the queue
+        self._geocode_futures = [] # Futures for the geocoding requests of the last map load
+        self._geocoded_results = queue.Queue() # (city, state, coords, from_cache) from workers to the UI thread
+        self._geocode_event_pending = threading.Event() # Set while a <<GeocodeResult>> event is queued
+        self._shutdown = threading.Event() # Set by on_closing; geocoding workers stop starting new requests
+        self._last_map_status = None # Text last shown in the map status label, see _set_map_status
         self.geolocated_count = 0 # Initialize count for geolocated markers (locations)
         self.skipped_count = 0 # Initialize count for skipped locations
-        self._geocoding_after_id = None # ID for the scheduled _process_geocoding_results after call
+        self.root.bind("<<GeocodeResult>>", self._process_geocoding_results)
+
+        # Background loading of the View Data treeview (see refresh_data_view)
+        self._cases_queue = queue.Queue()
+        self._lazy_generation = 0 # Incremented per refresh so stale results can be dropped
 
 
         # Always ensure DB is initialized before any data access
@@ -1602,20 +2572,16 @@ class CaseLogApp:
         self.status_label.grid(row=1, column=0, sticky='ew', padx=10, pady=(0, 5))
         self.update_status("Initializing...")
 
-        # Perform initial data loading and UI refresh
-        self.refresh_data_view() # Populate the treeview
-        self.load_map_markers() # This now starts the threaded geocoding
-        self.populate_graph_filters() # Populate filters for the graph
-        self.update_graph() # Display initial graph
+        self._finish_image_loads()
 
-        # Initial status is set by the map loading process or defaults below if map loading is skipped
-        # The _finalize_map_loading will set the final status
-        # Ensure status is cleared if thread finishes quickly
-        if not self.geocoding_thread or not self.geocoding_thread.is_alive():
-            self.update_status("Ready")
+        # Perform initial data loading and UI refresh
+        self.refresh_data_view() # Populate the treeview (loads in the background)
+        # Map and graph are built and filled when their tabs are first opened
+        self.update_status("Ready")
 
         # Set the window closing protocol to call the cleanup function
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+
     def create_widgets(self):
         """
         Creates the main notebook tabs and calls methods to populate them.
@@ -1651,12 +2617,29 @@ class CaseLogApp:
 
         self.create_entry_widgets()
         self.create_view_widgets()
-        self.create_map_widgets()
-        self.create_graph_widgets()
+        # The map widget and matplotlib figure are costly to build; wait until their tabs are opened
+        self._map_initialized = False
+        self._graph_initialized = False
+        self._graph_stale = False # Data changed while the Graphs tab was hidden; redraw when it is shown
+        self._refresh_pending = False # A _do_full_refresh is queued (see _schedule_full_refresh)
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_notebook_tab_changed)
         self.create_settings_widgets()
         self.create_about_widgets()
         # Ensure no call to create_dashboard_widgets remains
 
+    def on_notebook_tab_changed(self, event=None):
+        """Builds the Map View and Graphs tabs the first time they are selected."""
+        current_tab = self.notebook.select()
+        if current_tab == str(self.map_frame) and not self._map_initialized:
+            self._map_initialized = True
+            self.create_map_widgets() # Also loads the markers
+        elif current_tab == str(self.graph_frame) and not self._graph_initialized:
+            self._graph_initialized = True
+            self.create_graph_widgets()
+            self.populate_graph_filters() # Also draws the graph
+        elif current_tab == str(self.graph_frame) and self._graph_stale:
+            self.populate_graph_filters()
+
     def create_about_widgets(self):
         """Creates the widgets for the About tab with application info."""
         about_text = (
@@ -1711,7 +2694,6 @@ class CaseLogApp:
             "GitHub: https://github.com/RF-YVY\n"
         )
 
-        from tkinter import scrolledtext
         about_box = scrolledtext.ScrolledText(self.about_frame, wrap='word', font=("Segoe UI", 11), state='normal', height=28, width=100)
         about_box.insert('1.0', about_text)
         about_box.config(state='disabled')
@@ -1720,7 +2702,6 @@ class CaseLogApp:
         # Add clickable GitHub link at the bottom
         github_url = "https://github.com/RF-YVY"
         def open_github(event=None):
-            import webbrowser
             webbrowser.open_new(github_url)
 
         github_label = tk.Label(self.about_frame, text="Visit Developer GitHub: https://github.com/RF-YVY", fg="blue", cursor="hand2", font=("Segoe UI", 10, "underline"))
@@ -1769,6 +2750,10 @@ class CaseLogApp:
 
 
         self.entries = {} # Dictionary to hold Tkinter variables/widgets for form fields
+        self.combo_widgets = weakref.WeakValueDictionary() # Entries drop out when their widget is destroyed
+        self._field_getters = {}
+        self._field_clearers = {}
+        self._field_setters = {}
         # Frame to hold the grid of input fields
         self.field_frame_container = ttk.Frame(scrollable_frame) # Parent is scrollable_frame, store reference
         # Pack the field_frame_container below the top_section_frame within the scrollable_frame
@@ -1790,7 +2775,7 @@ class CaseLogApp:
             ("Type of Offense", "offense_type", "combo", []),# Changed to combo
             ("City of Offense", "city_of_offense", "combo", []), 
             ("State of Offense", "state_of_offense", "combo", US_STATE_ABBREVIATIONS), # Added State here
-            ("Device Type", "device_type", "combo", ["", "iOS", "Android", "ChromeOS", "Windows", "SD", "HDD", "SDD", "USB", "SW Return", "Zip file", "drone", "other"]),
+            ("Device Type", "device_type", "combo", DEVICE_TYPES),
             ("Model", "model", "entry"),
             ("OS", "os", "entry")
         ]
@@ -1811,15 +2796,19 @@ class CaseLogApp:
                 entry = tb.Entry(cell_frame, width=40)
                 entry.pack(side='top', fill='x', expand=True)
                 self.entries[key] = entry
+                self._field_getters[key] = lambda strip, w=entry: w.get().strip() if strip else w.get()
+                self._field_clearers[key] = lambda w=entry: w.delete(0, tk.END)
+                self._field_setters[key] = lambda value, w=entry: self._set_entry_text(w, value)
             elif field_type == "combo":
                 var = tk.StringVar()
                 # Load persistent values for editable combos
-                if key in ["examiner", "investigator", "agency", "offense_type", "city_of_offense"]:
+                if key in EDITABLE_COMBO_FIELDS:
                     combo_values = get_combo_values_db(key)
                 else:
                     combo_values = options[0] if options and options[0] else []
                 combo = ttk.Combobox(cell_frame, textvariable=var, values=combo_values, state="normal", width=38)
                 combo.pack(side='top', fill='x', expand=True)
+                self.combo_widgets[key] = combo
 
                 # Set default for State of Offense
                 if key == "state_of_offense":
@@ -1831,7 +2820,7 @@ class CaseLogApp:
                     var.set(combo_values[0])
 
                 # --- Add dynamic entry logic for editable combos ---
-                if key in ["examiner", "investigator", "agency", "offense_type", "city_of_offense"]:
+                if key in EDITABLE_COMBO_FIELDS:
                     def add_to_combo(event, combo=combo, var=var, key=key):
                         value = var.get().strip()
                         values = list(combo['values'])
@@ -1843,6 +2832,9 @@ class CaseLogApp:
                     combo.bind("<FocusOut>", add_to_combo)
 
                 self.entries[key] = var
+                self._field_getters[key] = lambda strip, v=var: v.get().strip() if strip else v.get()
+                self._field_clearers[key] = lambda key=key, v=var: self._reset_combo_var(key, v)
+                self._field_setters[key] = lambda value, v=var: v.set('' if value is None else str(value))
 
         # --- Data Recovered? and FPR Complete? on the same row ---
         # Place checkboxes after the last row of the grid, but before notes
@@ -1864,11 +2856,17 @@ class CaseLogApp:
         dr_chk = tb.Checkbutton(checks_inner, variable=dr_var, text="Data Recovered ?")
         dr_chk.pack(side='left', anchor='w', padx=(0, 30))
         self.entries['data_recovered'] = dr_var
+        self._field_getters['data_recovered'] = lambda strip: dr_var.get()
+        self._field_clearers['data_recovered'] = lambda: dr_var.set(False)
+        self._field_setters['data_recovered'] = lambda value: dr_var.set(value == "Yes")  # Stored as "Yes"/"No"/""
 
         fpr_var = tk.BooleanVar()
         fpr_chk = tb.Checkbutton(checks_inner, variable=fpr_var, text="FPR Complete ?")
         fpr_chk.pack(side='left', anchor='w', padx=(0, 0))
         self.entries['fpr_complete'] = fpr_var
+        self._field_getters['fpr_complete'] = lambda strip: fpr_var.get()
+        self._field_clearers['fpr_complete'] = lambda: fpr_var.set(False)
+        self._field_setters['fpr_complete'] = lambda value: fpr_var.set(bool(value))  # Stored as 0/1
 
 
         # --- Notes field ---
@@ -1886,6 +2884,10 @@ class CaseLogApp:
         txt_notes.pack(side='left', fill='both', expand=True)
 
         self.entries['notes'] = txt_notes # Store the Text widget reference
+        # "end-1c" excludes the trailing newline the Text widget always holds
+        self._field_getters['notes'] = lambda strip: txt_notes.get("1.0", "end-1c").strip() if strip else txt_notes.get("1.0", "end-1c")
+        self._field_clearers['notes'] = lambda: txt_notes.delete('1.0', tk.END)
+        self._field_setters['notes'] = lambda value: self._set_text_widget(txt_notes, value)
 
         # --- DateEntry Fields ---
         # This block must come AFTER the Notes field block (where notes_row is defined)
@@ -1904,6 +2906,9 @@ class CaseLogApp:
             date_entry.pack(side='left', fill='x', expand=True)
 
             self.entries[key] = date_entry
+            self._field_getters[key] = lambda strip, w=date_entry: self._date_entry_value(w)
+            self._field_clearers[key] = lambda w=date_entry: self._clear_date_entry(w)
+            self._field_setters[key] = lambda value, w=date_entry: self._set_date_entry(w, value)
 
 
         # --- Submit and Cancel Buttons ---
@@ -1930,36 +2935,35 @@ class CaseLogApp:
 
 
         # After all widgets are created in create_entry_widgets
-        for key in ["examiner", "investigator", "agency", "offense_type", "city_of_offense"]:
-            if key in self.entries and isinstance(self.entries[key], tk.StringVar):
-                combo_widget = None
-                for child in self.field_frame_container.winfo_children():
-                    for grandchild in child.winfo_children():
-                        if isinstance(grandchild, ttk.Combobox) and grandchild.cget('textvariable') == str(self.entries[key]):
-                            combo_widget = grandchild
-                            break
-                    if combo_widget:
-                        break
-                if combo_widget:
-                    combo_widget['values'] = get_unique_field_values(key)
+        editable_keys = list(EDITABLE_COMBO_FIELDS)
+        unique_values = get_unique_field_values_many(editable_keys)
+        for key in editable_keys:
+            combo_widget = self.combo_widgets.get(key)
+            if combo_widget:
+                combo_widget['values'] = unique_values[key]
 
         # Auto-populate Examiner with last used value
         last_examiner = self.get_last_examiner()
-        if last_examiner and 'examiner' in self.entries and isinstance(self.entries['examiner'], tk.StringVar):
-            self.entries['examiner'].set(last_examiner)
+        examiner_var = self.entries.get('examiner')
+        if last_examiner and isinstance(examiner_var, tk.StringVar):
+            examiner_var.set(last_examiner)
 
         # --- Auto-populate State of Offense with last used value (persistent) ---
         last_state = self.get_last_state_of_offense()
-        if last_state and 'state_of_offense' in self.entries and isinstance(self.entries['state_of_offense'], tk.StringVar):
-            self.entries['state_of_offense'].set(last_state)
+        state_var = self.entries.get('state_of_offense')
+        if last_state and isinstance(state_var, tk.StringVar):
+            state_var.set(last_state)
 
         # Save new state when changed
-        if 'state_of_offense' in self.entries and isinstance(self.entries['state_of_offense'], tk.StringVar):
-            def on_state_change_var(*args):
-                state = self.entries['state_of_offense'].get()
+        if isinstance(state_var, tk.StringVar):
+            def save_state():
+                state = state_var.get()
                 if state:
                     self.set_last_state_of_offense(state)
-            self.entries['state_of_offense'].trace_add('write', on_state_change_var)
+            def on_state_change_var(*args):
+                # Typing fires a write per keystroke; save once the value settles
+                self._debounce('state_pref', 400, save_state)
+            state_var.trace_add('write', on_state_change_var)
 
     def get_last_state_of_offense(self):
         """Return the last used state of offense from user prefs, or from the most recent case if not set."""
@@ -1967,15 +2971,7 @@ class CaseLogApp:
         if state:
             return state
         # Fallback: get from most recent case
-        try:
-            cases = get_all_cases_db()
-            for case in reversed(cases):
-                s = case.get('state_of_offense')
-                if s:
-                    return s
-        except Exception as e:
-            logging.warning(f"Could not get last state of offense: {e}")
-        return None
+        return get_last_nonempty_field_db('state_of_offense')
 
     def set_last_state_of_offense(self, state):
         """Persist the last used state of offense to user prefs."""
@@ -1983,17 +2979,8 @@ class CaseLogApp:
 
     def get_last_examiner(self):
         """Return the last used examiner from the most recent case, or None if not found."""
-        try:
-            cases = get_all_cases_db()
-            if cases:
-                # Find the most recent case with a non-empty examiner
-                for case in reversed(cases):
-                    examiner = (case.get('examiner') or '').strip()
-                    if examiner:
-                        return examiner
-        except Exception as e:
-            logging.warning(f"Could not get last examiner: {e}")
-        return None
+        examiner = get_last_nonempty_field_db('examiner')
+        return examiner.strip() if examiner else None
 
 
     def create_view_widgets(self):
@@ -2068,6 +3055,9 @@ class CaseLogApp:
         container.columnconfigure(0, weight=1)
 
         self.tree = ttk.Treeview(tree_frame, show='headings')
+        self._lazy_rows = {} # iid -> value tuple of each row inserted by the lazy loader
+        self._sort_cache = {} # (column, filter) -> (_cases_version, ascending ids, descending ids)
+        self._scroll_check_pending = False # Set while a _check_lazy_paging call is queued
 
         # Store the database column names along with display text and other config
         # Ensure 'id' is included but marked as not visible
@@ -2091,34 +3081,46 @@ class CaseLogApp:
             "created_at": {"text": "Created (MM-DD-YYYY)", "width": 100, "type": "date"},
             "notes": {"text": "Notes", "width": 200}
         };
+        # The config is fixed from here on; precompute what the column dialogs need
+        self._non_id_columns = tuple(k for k in self.tree_columns_config if k != 'id')
+        self._col_labels = {k: self.tree_columns_config[k]['text'] for k in self._non_id_columns}
+        # Columns the full reports include, and the display formatter for each typed column
+        self._report_columns = tuple(k for k in self._non_id_columns if self.tree_columns_config[k].get("visible", True))
+        self._column_formatters = {}
+        for k in self._non_id_columns:
+            col_type = self.tree_columns_config[k].get("type")
+            if col_type == "date":
+                self._column_formatters[k] = format_date_str_for_display
+            elif col_type == "boolean":
+                self._column_formatters[k] = format_bool_int
+        # Normalized (display label, column key) header names each importable column is matched by
+        self._import_header_names = tuple(
+            (self._col_labels[k].strip().casefold(), k.casefold(), k)
+            for k in self._non_id_columns if k != 'created_at'
+        )
 
-        # Use all keys from config as internal treeview columns
-        self.tree["columns"] = list(self.tree_columns_config.keys())
-        # Use only user-selected columns for Treeview display columns
-        visible_columns = self.get_visible_treeview_columns()
-        self.tree.configure(displaycolumns=visible_columns)
-
+        # Use all keys from config as internal treeview columns, but display only user-selected ones
+        self.tree.configure(columns=list(self.tree_columns_config.keys()),
+                            displaycolumns=self.get_visible_treeview_columns())
 
+        # One column() and one heading() call per column; every call is a Tcl round-trip
         for col_key, config in self.tree_columns_config.items():
-            self.tree.column(col_key, anchor='w', width=config["width"], stretch=tk.YES)
-            # Configure headings only for displayed columns
-            if col_key in visible_columns:
-                 self.tree.heading(col_key, text=config["text"], command=lambda c=col_key: self.sort_treeview_column(c))
-            self.tree.column(col_key, anchor='w', width=config["width"], stretch=tk.NO)
-            if not config.get("visible", True):
-                 self.tree.column(col_key, width=0, stretch=tk.NO) # Hide the column
+            if config.get("visible", True):
+                self.tree.column(col_key, anchor='w', width=config["width"], stretch=tk.NO)
+            else:
+                self.tree.column(col_key, anchor='w', width=0, minwidth=0, stretch=tk.NO) # Hide the column
+            # Headings are set for hidden columns too, so they are ready if shown later
+            self.tree.heading(col_key, text=config["text"], command=lambda c=col_key: self.sort_treeview_column(c))
 
 
         # Scrollbars for the Treeview
         vsb = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.tree_vsb = vsb
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
         self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-        # Bind vertical scrollbar to lazy loading
-        def on_vsb(*args):
-            self.on_treeview_scroll(*args)
-            vsb.set(*args)
-        vsb.config(command=on_vsb)
-        self.tree.bind("<MouseWheel>", lambda e: self.on_treeview_scroll("scroll", int(-1*(e.delta/120)), "units"))
+        # Bind vertical scrollbar to lazy loading; the Treeview updates the thumb through yscrollcommand
+        vsb.config(command=self.on_treeview_scroll)
+        self.tree.bind("<MouseWheel>", self.on_treeview_mousewheel)
 
         self.tree.grid(row=0, column=0, sticky='nsew')
         vsb.grid(row=0, column=1, sticky='ns')
@@ -2136,9 +3138,6 @@ class CaseLogApp:
         self.tree.bind('<Button-3>', self.on_treeview_right_click)  # Windows context menu
         self.tree.bind('<Menu>', self.on_treeview_right_click)  # Keyboard context menu key
         self.tree['takefocus'] = True
-        # Set accessible headings
-        for col_key, config in self.tree_columns_config.items():
-            self.tree.heading(col_key, text=config["text"], command=lambda c=col_key: self.sort_treeview_column(c))
         # Set accessible names for buttons
         for btn in [refresh_button, pdf_button, xlsx_button, edit_button, delete_button, undo_button, redo_button]:
             btn['takefocus'] = True
@@ -2169,21 +3168,45 @@ class CaseLogApp:
         menu.add_command(label="Export Selected as XLSX", command=self.export_selected_xlsx)
         menu.tk_popup(event.x_root, event.y_root)
 
+    def _report_rows(self, cases, columns, as_text=False):
+        """Returns one list per case of the columns' display values (dates as MM-DD-YYYY, FPR as Yes/No;
+        with as_text, every value as a string). Built column by column, so each column's formatter
+        is chosen once instead of per cell."""
+        def column_values(col):
+            values = [case.get(col, "") for case in cases]
+            fmt = self._column_formatters.get(col) or (str if as_text else None)
+            return list(map(fmt, values)) if fmt else values
+        return [list(row) for row in zip(*map(column_values, columns))]
+
+    def _selected_display_rows(self, selected):
+        """Returns (displayed column keys, iterator of value tuples of the selected items in those columns)."""
+        all_columns = self.tree['columns']
+        columns = self.tree['displaycolumns']
+        if tuple(columns) == ('#all',):
+            columns = all_columns
+        # Index map built once; Treeview item values are in tree['columns'] order
+        col_index = {col: i for i, col in enumerate(all_columns)}
+        indexes = [col_index[col] for col in columns]
+        row_values = self._tree_row_values
+        rows = (tuple(values[i] for i in indexes) for values in (row_values(iid) for iid in selected))
+        return columns, rows
+
     def copy_selected_treeview_rows(self):
         # Copy selected rows to clipboard as tab-separated text
         selected = self.tree.selection()
         if not selected:
             self.update_status("No rows selected to copy.")
             return
-        columns = self.tree['displaycolumns']
-        rows = []
-        for iid in selected:
-            values = self.tree.item(iid, 'values')
-            rows.append('\t'.join(str(values[self.tree['columns'].index(col)]) for col in columns))
-        text = '\n'.join(rows)
+        _, rows = self._selected_display_rows(selected)
+        # Rows are written straight into one buffer rather than kept as a list of strings
+        buf = io.StringIO()
+        for n, row in enumerate(rows):
+            if n:
+                buf.write('\n')
+            buf.write('\t'.join(str(value) for value in row))
         self.root.clipboard_clear()
-        self.root.clipboard_append(text)
-        self.update_status(f"Copied {len(rows)} row(s) to clipboard.")
+        self.root.clipboard_append(buf.getvalue())
+        self.update_status(f"Copied {len(selected)} row(s) to clipboard.")
 
     def export_selected_pdf(self):
         # Export selected rows as PDF (reuse custom report logic)
@@ -2191,9 +3214,10 @@ class CaseLogApp:
         if not selected:
             self.update_status("No rows selected to export.")
             return
-        columns = self.tree['displaycolumns']
+        # Rows are cut down to the displayed columns so they line up with the headers
+        columns, rows = self._selected_display_rows(selected)
+        rows = list(rows)
         headers = [self.tree_columns_config[c]['text'] for c in columns]
-        rows = [self.tree.item(iid, 'values') for iid in selected]
         self.export_custom_report_pdf(headers, rows)
 
     def export_selected_xlsx(self):
@@ -2202,9 +3226,10 @@ class CaseLogApp:
         if not selected:
             self.update_status("No rows selected to export.")
             return
-        columns = self.tree['displaycolumns']
+        # Rows are cut down to the displayed columns so they line up with the headers
+        columns, rows = self._selected_display_rows(selected)
+        rows = list(rows)
         headers = [self.tree_columns_config[c]['text'] for c in columns]
-        rows = [self.tree.item(iid, 'values') for iid in selected]
         self.export_custom_report_xlsx(headers, rows)
 
     def focus_next_widget(self, event):
@@ -2229,10 +3254,13 @@ class CaseLogApp:
         self.map_focal_state_var = tk.StringVar(value=self.get_map_focal_state())
         state_combo = ttk.Combobox(state_frame, textvariable=self.map_focal_state_var, values=US_STATE_ABBREVIATIONS, width=8, state='readonly')
         state_combo.pack(side='left')
-        def on_state_change(event=None):
+        def apply_focal_state():
             state = self.map_focal_state_var.get()
             self.set_map_focal_state(state)
             self.focus_map_on_state(state)
+        def on_state_change(event=None):
+            # Stepping through states with the arrow keys selects each one; only act on the last
+            self._debounce('map_focal_state', 300, apply_focal_state)
         state_combo.bind('<<ComboboxSelected>>', on_state_change)
         # If a state is already set, focus map on it after widget creation
         self.map_frame.after(500, lambda: self.focus_map_on_state(self.map_focal_state_var.get()))
@@ -2270,8 +3298,11 @@ class CaseLogApp:
 
         # No API key or MapTiler check needed
 
-        # Map widget
-        self.map_widget = tkintermapview.TkinterMapView(container, width=800, height=600, corner_radius=0)
+        # Map widget; tiles found in the local tile store are drawn without a download,
+        # and tiles downloaded while browsing are added to it
+        init_map_tile_store()
+        self.map_widget = TileStoreMapView(container, width=800, height=600, corner_radius=0,
+                                           database_path=MAP_TILE_CACHE_FILENAME)
         self.map_widget.pack(fill='both', expand=True)
 
         # Set initial position and zoom to Mississippi (or focal state if set)
@@ -2307,43 +3338,21 @@ class CaseLogApp:
 
         # Status label for map loading
         self.map_status_label = ttk.Label(container, text="", anchor='w')
+        self._last_map_status = ""
         self.map_status_label.pack(side='bottom', fill='x', pady=(5, 0))
 
         # Immediately load map markers after widget is created
         self.load_map_markers()
         if not self.map_markers:
-            self.map_status_label.config(text="Map status: 0 locations loaded")
-
-    def on_marker_click(self, info_text):
-        """Display marker information in a formatted messagebox."""
-        try:
-            # Split the info text into city/state and offenses
-            city_state, offenses = info_text.split("\n", 2)  # Take first two parts
-            title = city_state.strip()
-        
-            # Format the offense types for better readability
-            offenses = offenses.replace("Offense Types:", "").strip()
-            # Create bullet points for each offense type
-            offense_list = []
-            for offense in offenses.split(","):
-                if offense.strip():
-                    offense_list.append(f"• {offense.strip()}")
-        
-            # Join offense list with newlines
-            formatted_text = "\n".join(offense_list) if offense_list else "No offenses recorded"
-        
-            # Show the formatted information
-            Messagebox.show_info(
-                title=title,  # City, State
-                message=f"Offense Types:\n{formatted_text}"  # Bulleted list of offenses
-            )
-        except Exception as e:
-            logging.error(f"Error displaying marker info: {e}")
-            # Even in case of error, show something meaningful
-            Messagebox.show_info(
-                title="Location Information",
-                message=info_text
-            )
+            self._set_map_status("Map status: 0 locations loaded")
+
+    def on_marker_click(self, location):
+        """Display the offense types recorded at a (city, state) marker in a messagebox."""
+        city, state = location
+        Messagebox.show_info(
+            title=f"{city}, {state}",
+            message=self._marker_message_by_location.get(location, "Offense Types:\nNo offenses recorded")
+        )
 
     def create_graph_widgets(self):
         """Creates widgets for the Graphs tab."""
@@ -2361,11 +3370,7 @@ class CaseLogApp:
         self.graph_type_combo = tb.Combobox(
             controls_frame,
             textvariable=self.graph_type_var,
-            values=[
-                "Offense Type", "Device Type", "OS", "Agency", "State of Offense",
-                "Examiner", "Investigator", "Year", "City of Offense", "Total Volume (GB/TB)",
-                "Total Volume by Examiner", "Total Volume by Investigator", "Total Volume by Agency", "Total Volume by Device Type"
-            ],
+            values=GRAPH_TYPES,
             state="readonly"
         )
         self.graph_type_combo.pack(side='left', padx=(0, 10))
@@ -2388,6 +3393,7 @@ class CaseLogApp:
         graph_frame.pack(fill='both', expand=True, padx=10, pady=10)
 
         self.fig, self.ax = plt.subplots(figsize=(10, 6))
+        self._graph_state = None # (key, bars, value texts, labels) of the drawn graph, for _reuse_graph_bars
         self.canvas_agg = FigureCanvasTkAgg(self.fig, master=graph_frame)
         canvas_widget = self.canvas_agg.get_tk_widget()
         canvas_widget.pack(fill='both', expand=True)
@@ -2405,7 +3411,8 @@ class CaseLogApp:
             self.fig.set_size_inches(max(width/96, 4), max(height/96, 3), forward=True)
             self.canvas_agg.draw_idle()
 
-        graph_frame.bind('<Configure>', on_graph_frame_configure)
+        # Dragging the window edge sends a <Configure> per pixel; resize once it stops
+        graph_frame.bind('<Configure>', lambda e: self._debounce('graph_resize', 100, on_graph_frame_configure))
         # Force an initial resize after widgets are packed
         graph_frame.after(100, on_graph_frame_configure)
 
@@ -2418,41 +3425,20 @@ class CaseLogApp:
                     on_graph_frame_configure()
 
         if hasattr(self, 'notebook'):
-            self.notebook.bind('<<NotebookTabChanged>>', on_tab_changed)
+            self.notebook.bind('<<NotebookTabChanged>>', on_tab_changed, add='+')
 
     def update_graph(self):
         """Update the graph display in the Graphs tab."""
-        cases = get_all_cases_db()
+        if self.ax is None:
+            return # Graphs tab not opened yet; it draws when built
         graph_type = self.graph_type_var.get()
         year_filter = self.graph_year_var.get()
 
-        # Filter by year if selected
-        if year_filter and year_filter != "All":
-            cases = [
-                case for case in cases
-                if case.get("start_date", "").startswith(year_filter)
-            ]
-
         # Handle total volume by groupings
-        group_volume_types = {
-            "Total Volume by Examiner": "examiner",
-            "Total Volume by Investigator": "investigator",
-            "Total Volume by Agency": "agency",
-            "Total Volume by Device Type": "device_type"
-        }
-        if graph_type in group_volume_types:
-            group_field = group_volume_types[graph_type]
-            data = {}
-            for case in cases:
-                group_val = (case.get(group_field) or "Unknown").strip() or "Unknown"
-                try:
-                    vol = case.get("volume_size_gb")
-                    if vol is not None and vol != "":
-                        data[group_val] = data.get(group_val, 0.0) + float(vol)
-                except Exception:
-                    continue
-            # Sort by total volume descending
-            sorted_items = sorted(data.items(), key=lambda x: x[1], reverse=True)
+        if graph_type in GRAPH_VOLUME_FIELDS:
+            group_field = GRAPH_VOLUME_FIELDS[graph_type]
+            # Already sorted by total volume descending
+            sorted_items = sum_volume_by_field_db(group_field, year_filter)
             labels = [item[0] for item in sorted_items]
             values = [item[1] for item in sorted_items]
             # Decide unit (GB or TB)
@@ -2466,32 +3452,26 @@ class CaseLogApp:
                 y_label = "Total Volume (GB)"
                 display_values = [f"{v:.2f}" for v in values]
                 plot_values = values
+            key = (graph_type, y_label, len(labels))
+            if self._reuse_graph_bars(key, labels, plot_values, display_values):
+                return
             self.ax.clear()
-            bars = self.ax.bar(labels, plot_values, color="#4a90e2", align='center')
+            bars = self._plot_category_bars(labels, plot_values)
             self.ax.set_xlabel(group_field.replace('_', ' ').title())
             self.ax.set_ylabel(y_label)
             self.ax.set_title(f"{graph_type}")
-            self.ax.tick_params(axis='x', rotation=45)
-            self.fig.autofmt_xdate(rotation=45)
-            self.fig.subplots_adjust(bottom=0.25)
             # Annotate values on bars
-            for bar, val in zip(bars, display_values):
-                height = bar.get_height()
-                self.ax.text(bar.get_x() + bar.get_width()/2, height, val, ha='center', va='bottom', fontsize=9)
+            texts = [
+                self.ax.text(bar.get_x() + bar.get_width()/2, bar.get_height(), val, ha='center', va='bottom', fontsize=9)
+                for bar, val in zip(bars, display_values)
+            ]
+            self._graph_state = (key, list(bars), texts, labels)
             self.fig.tight_layout()
-            self.canvas_agg.draw()
+            self.canvas_agg.draw_idle()
             return
 
-        if graph_type == "Total Volume (GB/TB)":
-            # Calculate total volume
-            total_gb = 0.0
-            for case in cases:
-                try:
-                    val = case.get("volume_size_gb")
-                    if val is not None and val != "":
-                        total_gb += float(val)
-                except Exception:
-                    continue
+        if graph_type == GRAPH_TOTAL_VOLUME:
+            total_gb = total_volume_db(year_filter)
             # Decide unit
             if total_gb > 999:
                 total_tb = total_gb / 1024.0
@@ -2503,68 +3483,81 @@ class CaseLogApp:
                 y_val = total_gb
                 y_label = "Total Volume (GB)"
 
+            key = (graph_type, y_label)
+            if self._reuse_graph_bars(key, ["Total"], [y_val], [display_value]):
+                return
             # Plot a single bar
             self.ax.clear()
-            self.ax.bar(["Total"], [y_val], color="#4a90e2", align='center')
+            bars = self._plot_category_bars(["Total"], [y_val], rotation=0)
             self.ax.set_xlabel("")
             self.ax.set_ylabel(y_label)
             self.ax.set_title("Total Volume of All Cases")
             # Annotate value on bar
-            self.ax.text(0, y_val, display_value, ha='center', va='bottom', fontsize=14, fontweight='bold')
+            text = self.ax.text(0, y_val, display_value, ha='center', va='bottom', fontsize=14, fontweight='bold')
+            self._graph_state = (key, list(bars), [text], ["Total"])
             self.fig.tight_layout()
-            self.canvas_agg.draw()
+            self.canvas_agg.draw_idle()
             return
 
         # Map graph type to DB field
-        graph_field_map = {
-            "Offense Type": "offense_type",
-            "Device Type": "device_type",
-            "OS": "os",
-            "Agency": "agency",
-            "State of Offense": "state_of_offense",
-            "Examiner": "examiner",
-            "Investigator": "investigator",
-            "Year": "start_date",
-            "City of Offense": "city_of_offense"
-        }
-        field = graph_field_map.get(graph_type, "offense_type")
-
-        # Prepare data
-        data = {}
-        if field == "start_date" or graph_type == "Year":
-            for case in cases:
-                date_str = case.get("start_date", "")
-                year = date_str[:4] if date_str else "Unknown"
-                data[year] = data.get(year, 0) + 1
-            xlabel = "Year"
-        else:
-            for case in cases:
-                value = case.get(field, "") or "Unknown"
-                data[value] = data.get(value, 0) + 1
-            xlabel = graph_type
+        field = GRAPH_COUNT_FIELDS.get(graph_type, "offense_type")
+
+        xlabel = "Year" if field == "start_date" else graph_type
 
-        # Sort data for display (greatest to least)
-        sorted_items = sorted(data.items(), key=lambda x: x[1], reverse=True)
+        # Counted and sorted for display (greatest to least) in SQL
+        sorted_items = count_cases_by_field_db(field, year_filter)
         labels = [item[0] for item in sorted_items]
         values = [item[1] for item in sorted_items]
 
+        key = (graph_type, len(labels))
+        if labels and self._reuse_graph_bars(key, labels, values):
+            return
+
         # Clear and plot
         self.ax.clear()
         if not labels:
             self.ax.text(0.5, 0.5, "No data to display", ha='center', va='center', fontsize=16)
+            self._graph_state = None
         else:
-            bars = self.ax.bar(labels, values, color="#4a90e2", align='center')
+            bars = self._plot_category_bars(labels, values)
             self.ax.set_xlabel(xlabel)
             self.ax.set_ylabel("Count")
             self.ax.set_title(f"{graph_type} Distribution")
-            self.ax.tick_params(axis='x', rotation=45)
-            # For better label spacing
-            self.fig.autofmt_xdate(rotation=45)
-            # Optionally, adjust bottom margin for long labels
-            self.fig.subplots_adjust(bottom=0.25)
+            self._graph_state = (key, list(bars), [], labels)
 
         self.fig.tight_layout()
-        self.canvas_agg.draw()
+        self.canvas_agg.draw_idle()
+
+    def _plot_category_bars(self, labels, values, rotation=45):
+        """Draws one bar per label at numeric x positions and names them with fixed tick labels,
+        which skips matplotlib's string-category unit conversion and tick locating. Labels are
+        slanted (right-aligned) by default so long names don't overlap. Returns the bars."""
+        x = range(len(labels))
+        bars = self.ax.bar(x, values, color="#4a90e2", align='center')
+        self.ax.set_xticks(x)
+        self.ax.set_xticklabels(labels, rotation=rotation, ha='right' if rotation else 'center')
+        return bars
+
+    def _reuse_graph_bars(self, key, labels, values, display_values=()):
+        """If the drawn graph has the same key (type, unit and bar count), move its bars and value
+        labels to the new values and rename the ticks instead of rebuilding the figure.
+        The layout pass only reruns when the tick labels changed. Returns True if it reused the graph."""
+        if self._graph_state is None or self._graph_state[0] != key:
+            return False
+        _, bars, texts, drawn_labels = self._graph_state
+        for bar, value in zip(bars, values):
+            bar.set_height(value)
+        for text, bar, label in zip(texts, bars, display_values):
+            text.set_text(label)
+            text.set_y(bar.get_height())
+        self.ax.relim()
+        self.ax.autoscale_view()
+        if labels != drawn_labels:
+            self.ax.set_xticklabels(labels, rotation=45, ha='right')
+            self._graph_state = (key, bars, texts, labels)
+            self.fig.tight_layout() # Longer or shorter names change the margins
+        self.canvas_agg.draw_idle()
+        return True
 
     def create_settings_widgets(self):
         # """Creates the widgets for the Settings tab."""
@@ -2713,15 +3706,16 @@ class CaseLogApp:
             # --- Undo/Redo support: Save old data before update ---
             old_case = get_case_by_id_db(case_id_to_update)
             if update_case_db(case_id_to_update, case_data):
-                self.push_view_edit_history(old_case, case_data)
+                # Record just the columns that changed, as stored, so undo/redo rewrite only those
+                new_case = get_case_by_id_db(case_id_to_update)
+                if old_case and new_case:
+                    changes = {field: (old_case[field], new_case[field]) for field in _UPDATE_CASE_COLUMNS if old_case[field] != new_case[field]}
+                    if changes:
+                        self.push_view_edit_history(case_id_to_update, changes)
                 Messagebox.show_info("Success", f"Case ID {case_id_to_update} updated successfully.")
                 logging.info(f"Case ID {case_id_to_update} updated.")
                 self.clear_entry_form() # Clear form and reset editing state
-                self.refresh_data_view() # Refresh the view to show changes
-                # Reload map markers and graphs as data might affect them
-                if hasattr(self, 'map_widget'):
-                     self.load_map_markers() # This will start a new threaded load
-                self.populate_graph_filters() # This also calls update_graph
+                self._schedule_full_refresh() # Refresh the view, map markers and graphs to show changes
                 self.update_status(f"Case ID {case_id_to_update} updated.")
 
             else:
@@ -2739,11 +3733,7 @@ class CaseLogApp:
                 Messagebox.show_info("Success", "Case submitted successfully.")
                 logging.info(f"New case '{case_number}' submitted.")
                 self.clear_entry_form() # Clear form after successful submission
-                self.refresh_data_view() # Refresh the view to show the new case
-                # Reload map markers and graphs for the new data
-                if hasattr(self, 'map_widget'):
-                     self.load_map_markers() # This will start a new threaded load
-                self.populate_graph_filters() # This also calls update_graph
+                self._schedule_full_refresh() # Refresh the view, map markers and graphs for the new case
                 self.update_status(f"New case '{case_number}' submitted.")
 
             else:
@@ -2751,15 +3741,8 @@ class CaseLogApp:
                 Messagebox.show_error("Database Error", f"Failed to submit case '{case_number}'. It may already exist. See log for details.")
                 self.update_status(f"Failed to submit case '{case_number}'.")
 
-        # Before/after adding the case, update combo values for persistent fields
-        for key in ["examiner", "investigator", "agency", "offense_type", "city_of_offense"]:
-            if key in self.entries and isinstance(self.entries[key], tk.StringVar):
-                value = self.entries[key].get().strip()
-                if value:
-                    values = get_combo_values_db(key)
-                    if value not in values:
-                        values.append(value)
-                        set_combo_values_db(key, values)
+        # Remember new values for the persistent combo fields
+        add_combo_values_db({key: case_data.get(key) for key in EDITABLE_COMBO_FIELDS})
 
         # No matter if insert or update, refresh related parts of the UI
         # Already done within the if/else blocks above
@@ -2767,48 +3750,67 @@ class CaseLogApp:
 
     def collect_form_data(self, for_validation=True):
         """Collects data from the entry form widgets into a dictionary.
-           Handles different widget types.
+           Each field is read by the getter registered when its widget was built.
            Use for_validation=False to collect raw values without stripping."""
-        case_data = {}
-        for key, widget in self.entries.items():
-            if isinstance(widget, ttk.Entry):
-                value = widget.get().strip() if for_validation else widget.get()
-                case_data[key] = value
-            elif isinstance(widget, tk.StringVar): # Combobox StringVar
-                value = widget.get().strip() if for_validation else widget.get()
-                case_data[key] = value
-            elif isinstance(widget, tk.BooleanVar): # Checkbutton BooleanVar
-                case_data[key] = widget.get() # This returns True/False directly
-            elif isinstance(widget, tk.Text): # Text widget for Notes
-                # Get text from 1.0 to end-1c (to exclude the trailing newline)
-                value = widget.get("1.0", "end-1c").strip() if for_validation else widget.get("1.0", "end-1c")
-                case_data[key] = value
-            elif isinstance(widget, DateEntry): # DateEntry widget
-                date_str = widget.entry.get()
-                if date_str:
-                    try:
-                        # Parse using the widget's dateformat (should be %m-%d-%Y)
-                        date_obj = datetime.strptime(date_str, '%m-%d-%Y').date()
-                        case_data[key] = date_obj.strftime('%Y-%m-%d')
-                    except ValueError:
-                        case_data[key] = None
-                else:
-                    case_data[key] = None
-            elif isinstance(widget, tk.StringVar) and key in ["start_date", "end_date"]:
-                value = widget.get().strip()
-                if value:
-                    try:
-                        date_obj = datetime.strptime(value, '%m-%d-%Y').date()
-                        case_data[key] = date_obj.strftime('%Y-%m-%d')
-                    except Exception:
-                        case_data[key] = None
-                else:
-                    case_data[key] = None
-            # Add handling for other widget types if any exist
-            # else:
-            #     logging.warning(f"Unknown widget type for key '{key}' during data collection: {type(widget)}")
+        return {key: get(for_validation) for key, get in self._field_getters.items()}
+
+    @staticmethod
+    def _date_entry_value(widget):
+        """Returns a DateEntry's MM-DD-YYYY text as YYYY-MM-DD, or None if it is empty or invalid."""
+        date_str = widget.entry.get()
+        if not date_str:
+            return None
+        try:
+            return datetime.strptime(date_str, '%m-%d-%Y').date().strftime('%Y-%m-%d')
+        except ValueError:
+            return None
 
-        return case_data
+    @staticmethod
+    def _clear_date_entry(widget):
+        """Empties a DateEntry's text."""
+        try:
+            widget.entry.delete(0, tk.END)
+            widget._set_text("")
+        except:
+            pass
+
+    @staticmethod
+    def _set_entry_text(widget, value):
+        """Replaces an Entry's text with value, leaving it empty for None."""
+        widget.delete(0, tk.END)
+        if value is not None:
+            widget.insert(0, str(value))
+
+    @staticmethod
+    def _set_text_widget(widget, value):
+        """Replaces a Text widget's contents with value, leaving it empty for None/''."""
+        widget.delete('1.0', tk.END)
+        if value:
+            widget.insert('1.0', str(value))
+
+    @staticmethod
+    def _set_date_entry(widget, value):
+        """Shows a stored YYYY-MM-DD date in a DateEntry as MM-DD-YYYY; empty or invalid dates clear it."""
+        widget.entry.delete(0, tk.END)
+        # The DB format is fixed, so reorder the slices instead of a strptime/strftime round trip
+        if value and len(value) == 10 and value[4] == '-' and value[7] == '-':
+            year, month, day = value[:4], value[5:7], value[8:10]
+            if year.isdigit() and month.isdigit() and day.isdigit():
+                widget.entry.insert(0, f"{month}-{day}-{year}")
+
+    def _reset_combo_var(self, key, var):
+        """Resets a combobox field to its default: MS for the state, else the first listed value."""
+        combo_widget = self.combo_widgets.get(key)
+        if combo_widget:
+            current_values = combo_widget.cget('values')
+            if key == "state_of_offense" and "MS" in current_values:
+                var.set("MS")
+            elif current_values:
+                var.set(current_values[0])
+            else:
+                var.set('')
+        else:
+            var.set('')
 
 
     def clear_entry_form(self):
@@ -2820,68 +3822,59 @@ class CaseLogApp:
             self.notebook.tab(self.entry_frame, text="New Case Entry")
 
 
-        for key, widget in self.entries.items():
-            if isinstance(widget, ttk.Entry):
-                widget.delete(0, tk.END)
-            elif isinstance(widget, tk.StringVar):
-                combo_widget = None
-                if hasattr(self, 'field_frame_container'):
-                    for child in self.field_frame_container.winfo_children():
-                        for grandchild in child.winfo_children():
-                            if isinstance(grandchild, ttk.Combobox) and grandchild.cget('textvariable') == str(widget):
-                                combo_widget = grandchild
-                                break
-                        if combo_widget:
-                            break
-                if combo_widget:
-                    current_values = combo_widget.cget('values')
-                    if key == "state_of_offense" and "MS" in current_values:
-                        widget.set("MS")
-                    elif current_values:
-                        widget.set(current_values[0])
-                    else:
-                        widget.set('')
-                else:
-                    widget.set('')
-            elif isinstance(widget, tk.BooleanVar):
-                widget.set(False)
-            elif isinstance(widget, tk.Text):
-                widget.delete('1.0', tk.END)
-            elif isinstance(widget, DateEntry):
-                try:
-                    widget.entry.delete(0, tk.END)
-                    widget._set_text("")
-                except:
-                    pass
+        for clear in self._field_clearers.values():
+            clear()
 
         # Auto-populate Examiner with last used value
         last_examiner = self.get_last_examiner()
-        if last_examiner and 'examiner' in self.entries and isinstance(self.entries['examiner'], tk.StringVar):
-            self.entries['examiner'].set(last_examiner)
+        examiner_var = self.entries.get('examiner')
+        if last_examiner and isinstance(examiner_var, tk.StringVar):
+            examiner_var.set(last_examiner)
 
     # Removed duplicate/broken load_map_markers. The correct version is defined earlier in the class.
 
+    def _finish_image_loads(self):
+        """Applies finished logo/marker icon decodes; retries shortly for any still running."""
+        pending = []
+        for future, apply in self._image_loads:
+            if not future.done():
+                pending.append((future, apply))
+                continue
+            try:
+                apply(future.result())
+            except Exception as e:
+                apply(None, e)
+        self._image_loads = pending
+        if pending:
+            self.root.after(50, self._finish_image_loads)
+
+    def _load_image_async(self, decode, path, apply):
+        """Runs decode(path) (cached, see cached_image_decode) on the image worker pool and
+        passes the result to apply on the Tk thread; only the PhotoImage is built there."""
+        polling = bool(self._image_loads)
+        self._image_loads.append((self._image_pool.submit(cached_image_decode, decode, path), apply))
+        if not polling:
+            self.root.after(20, self._finish_image_loads)
+
     def load_logo_image(self):
-        """Loads and scales the logo image for use in the application."""
+        """Loads and scales the logo image for use in the application (decoded in the background)."""
+        self._load_image_async(decode_logo_image, self.logo_path.get(), self._apply_logo_image)
+
+    def _apply_logo_image(self, image, error=None):
+        """Shows a decoded logo (see decode_logo_image) in the Entry tab and settings preview,
+        or clears them if image is None."""
         try:
-            # Load and scale logo for entry tab
-            image = Image.open(self.logo_path.get())
-            # Scale to reasonable height (100px) maintaining aspect ratio
-            aspect_ratio = image.size[0] / image.size[1]
-            new_height = 100
-            new_width = int(new_height * aspect_ratio)
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            if image is None:
+                raise error or ValueError("no logo image")
             self.logo_image_tk = ImageTk.PhotoImage(image)
 
             # Update logo in entry tab if label exists
             if self.entry_logo_label:
                 self.entry_logo_label.config(image=self.logo_image_tk)
 
-            # Create smaller version for settings preview
-            preview_height = 100
-            preview_width = int(preview_height * aspect_ratio)
-            preview_image = image.resize((preview_width, preview_height), Image.Resampling.LANCZOS)
-            self.logo_image_tk_preview = ImageTk.PhotoImage(preview_image)
+            # Settings preview uses the same 100px-high size, so it shares the PhotoImage
+            preview_width = image.size[0]
+            self.logo_image_tk_preview = self.logo_image_tk
 
             # Update preview in settings if canvas exists
             if self.logo_preview_canvas:
@@ -2902,17 +3895,23 @@ class CaseLogApp:
                 self.logo_preview_canvas.delete("all")
                 self.logo_preview_canvas.create_text(100, 50, text="No Logo", anchor='center')
 
-    def load_marker_icon_image(self):
-        """Loads and scales the marker icon image for use in the application."""
+    def load_marker_icon_image(self, on_loaded=None):
+        """Loads and scales the marker icon image for use in the application (decoded in the background).
+        on_loaded, if given, is called on the Tk thread once the new icon is installed."""
+        def apply(images, error=None):
+            self._apply_marker_icon_image(images, error)
+            if on_loaded:
+                on_loaded()
+        self._load_image_async(decode_marker_icon_image, MARKER_ICON_FILENAME, apply)
+
+    def _apply_marker_icon_image(self, images, error=None):
+        """Installs decoded (map, preview) marker icon images (see decode_marker_icon_image),
+        or clears them if images is None."""
         try:
-            # Load and scale marker icon for map markers
-            image = Image.open(MARKER_ICON_FILENAME)
-            # Scale to 20x20 for map markers
-            map_image = image.resize((20, 20), Image.Resampling.LANCZOS)
+            if images is None:
+                raise error or ValueError("no marker icon image")
+            map_image, preview_image = images
             self.marker_icon_tk_map = ImageTk.PhotoImage(map_image)
-
-            # Create larger version for settings preview (50x50)
-            preview_image = image.resize((50, 50), Image.Resampling.LANCZOS)
             self.marker_icon_tk_preview = ImageTk.PhotoImage(preview_image)
 
             # Update preview in settings if canvas exists
@@ -2987,38 +3986,23 @@ class CaseLogApp:
             # Get all cases
             cases = get_all_cases_db()
 
-            # Prepare table data
-            headers = [
-                config["text"] for key, config in self.tree_columns_config.items()
-                if config.get("visible", True) and key not in ['id']
-            ]
-            
-            data = [headers]  # Start with headers
-            
-            for case in cases:
-                row = []
-                for key, config in self.tree_columns_config.items():
-                    if config.get("visible", True) and key != 'id':
-                        value = case.get(key, '')
-                        if key in ['start_date', 'end_date', 'created_at']:
-                            value = format_date_str_for_display(value)
-                        elif key == 'fpr_complete':
-                            value = format_bool_int(value)
-                        row.append(str(value))
-                data.append(row)
-
-            # Create the table
-            table = Table(data)
+            # Prepare table data: the header row, then every case as wrapping display text
+            columns = self._report_columns
+            data = [[self._col_labels[key] for key in columns]]
+            data.extend(pdf_table_cells(self._report_rows(cases, columns, as_text=True), 8))
+
+            # Create the table. LongTable with fixed column widths (the Treeview widths, scaled to
+            # the page) lays out page by page and repeats the header row on each page.
+            weights = [self.tree_columns_config[key]["width"] or 100 for key in columns]
+            col_widths = [doc.width * w / sum(weights) for w in weights] if weights else None
+            table = LongTable(data, repeatRows=1, colWidths=col_widths)
+            # Body cells already default to Helvetica on white; only the header and grid need styling
             table.setStyle(TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
                 ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
                 ('FONTSIZE', (0, 0), (-1, 0), 10),
                 ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
                 ('FONTSIZE', (0, 1), (-1, -1), 8),
                 ('GRID', (0, 0), (-1, -1), 1, colors.black),
                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
@@ -3054,27 +4038,12 @@ class CaseLogApp:
             
             # Get all cases
             cases = get_all_cases_db()
-            
-            # Convert to pandas DataFrame
-            df = pd.DataFrame(cases)
-            
-            # Reorder columns based on tree_columns_config
-            visible_columns = [
-                key for key, config in self.tree_columns_config.items()
-                if config.get("visible", True)
-            ]
-            df = df[visible_columns]
-            
-            # Rename columns using display text from tree_columns_config
-            column_names = {
-                key: config["text"]
-                for key, config in self.tree_columns_config.items()
-                if config.get("visible", True)
-            }
-            df = df.rename(columns=column_names)
-            
-            # Export to Excel
-            df.to_excel(filename, index=False)
+
+            # Stream the report columns straight from the case dicts, labelled with their display text
+            columns = self._report_columns
+            headers = [self._col_labels[key] for key in columns]
+            rows = ([case.get(key) for key in columns] for case in cases)
+            write_xlsx_sheets(filename, [('Sheet1', headers, rows)])
             
             self.update_status("Excel report generated successfully.")
             Messagebox.show_info("Success", "Excel report generated successfully.")
@@ -3097,7 +4066,7 @@ class CaseLogApp:
         # The treeview item ID may be a string (e.g., 'I001'), but the DB expects an integer primary key.
         # Get the actual DB id from the first column of the treeview values:
         try:
-            values = self.tree.item(item_id, 'values')
+            values = self._tree_row_values(item_id)
             if not values:
                 Messagebox.show_error("Error", "Could not retrieve case data from selection.")
                 return
@@ -3126,42 +4095,10 @@ class CaseLogApp:
             Messagebox.show_error("Error", f"Failed to load case for editing: {e}")
 
     def populate_entry_form(self, case_data):
-        """Populates the entry form with the provided case data."""
-        for key, widget in self.entries.items():
-            value = case_data.get(key)
-            
-            if isinstance(widget, ttk.Entry):
-                widget.delete(0, tk.END)
-                if value is not None:  # Only set if value exists
-                    widget.insert(0, str(value))
-                    
-            elif isinstance(widget, tk.StringVar):
-                if value is not None:
-                    widget.set(str(value))
-                else:
-                    widget.set('')
-                
-            elif isinstance(widget, tk.BooleanVar):
-                if key == 'fpr_complete':
-                    widget.set(bool(value))  # Convert 0/1 to False/True
-                elif key == 'data_recovered':
-                    widget.set(value == "Yes")  # Convert "Yes"/"No"/"" to True/False
-                
-            elif isinstance(widget, tk.Text):
-                widget.delete('1.0', tk.END)
-                if value:
-                    widget.insert('1.0', str(value))
-                
-            elif isinstance(widget, DateEntry):
-                try:
-                    if value:
-                        date_obj = datetime.strptime(value, '%Y-%m-%d').date()
-                        widget.entry.delete(0, tk.END)
-                        widget.entry.insert(0, date_obj.strftime('%m-%d-%Y'))
-                    else:
-                        widget.entry.delete(0, tk.END)
-                except Exception:
-                    widget.entry.delete(0, tk.END)
+        """Populates the entry form with the provided case data.
+           Each field is loaded by the setter registered when its widget was built."""
+        for key, set_value in self._field_setters.items():
+            set_value(case_data.get(key))
     
     def delete_selected_cases(self):
         """Deletes selected cases from the database after confirmation."""
@@ -3194,24 +4131,22 @@ class CaseLogApp:
             self.update_status("Delete cancelled by user.")
             return
 
-        # Try to delete each selected case
-        deleted_count = 0
-        failed_count = 0
-
         try:
-            for case_id in selected_items:
-                if delete_case_db(case_id):
-                    deleted_count += 1
-                else:
-                    failed_count += 1
-                    logging.error(f"Failed to delete case ID {case_id}")
-
-            # Refresh the view after deletions
-            self.refresh_data_view()
-            # self.create_dashboard_widgets()  # Removed: dashboard no longer exists
-            if hasattr(self, 'map_widget'):
-                self.load_map_markers()
-            self.populate_graph_filters()
+            # Treeview item ids aren't case ids; the DB id is the first value of each row
+            case_ids = [self._tree_row_values(iid)[0] for iid in selected_items]
+            # Delete them all in one transaction
+            deleted_count = delete_cases_db(case_ids)
+            failed_count = len(case_ids) - deleted_count
+            if failed_count:
+                logging.error(f"Failed to delete {failed_count} of {len(case_ids)} selected case(s)")
+            else:
+                # Drop the rows now, in one Tcl call, so they vanish before the dialog below
+                self.tree.delete(*selected_items)
+                for iid in selected_items:
+                    self._lazy_rows.pop(iid, None)
+
+            # Refresh the view, map markers and graphs after deletions
+            self._schedule_full_refresh()
             
             # Show results
             status = f"Deleted {deleted_count} case(s)"
@@ -3254,8 +4189,8 @@ class CaseLogApp:
             
         try:
             # Copy selected file to app_data directory as logo.png
-            img = Image.open(filename)
-            img.save(LOGO_FILENAME, 'PNG')  # Always save as PNG
+            save_image_as_png(filename, LOGO_FILENAME, LOGO_MAX_SIZE)  # Always save as PNG, at display size
+            invalidate_logo_reader()
             
             # Update logo path and reload
             self.logo_path.set(LOGO_FILENAME)
@@ -3293,15 +4228,13 @@ class CaseLogApp:
             
         try:
             # Copy selected file to app_data directory as marker_icon.png
-            img = Image.open(filename)
-            img.save(MARKER_ICON_FILENAME, 'PNG')  # Always save as PNG
-            
-            # Reload marker icon
-            self.load_marker_icon_image()
+            save_image_as_png(filename, MARKER_ICON_FILENAME, MARKER_ICON_MAX_SIZE)  # Always save as PNG, at display size
             
-            # If map is loaded, refresh markers with new icon
-            if hasattr(self, 'map_widget'):
-                self.load_map_markers()
+            # Reload marker icon; once it is decoded, refresh the map markers (if the map is loaded)
+            def refresh_markers():
+                if hasattr(self, 'map_widget'):
+                    self.load_map_markers(force=True)
+            self.load_marker_icon_image(on_loaded=refresh_markers)
             
             logging.info(f"New marker icon selected and saved: {filename}")
             self.update_status("Marker icon updated successfully.")
@@ -3314,8 +4247,22 @@ class CaseLogApp:
             )
             self.update_status("Error updating marker icon.")
 
+    def _import_header_map(self, excel_columns):
+        """Maps spreadsheet headers to case_log columns by display label or column key (case-insensitive)."""
+        # Normalized header -> first Excel column with that header, built once
+        excel_col_by_header = {}
+        for excel_col in excel_columns:
+            excel_col_by_header.setdefault(str(excel_col).strip().casefold(), excel_col)
+
+        excel_header_to_db_key = {}
+        for label, key_name, col_key in self._import_header_names:
+            excel_col = excel_col_by_header.get(label) or excel_col_by_header.get(key_name)
+            if excel_col:
+                excel_header_to_db_key[excel_col] = col_key
+        return excel_header_to_db_key
+
     def import_cases_from_xlsx(self):
-        """Imports case data from a selected XLSX file."""
+        """Imports case data from a selected XLSX file; the file is read and saved on a background thread."""
         file_path = filedialog.askopenfilename(
             title="Select XLSX File",
             filetypes=[("Excel files", "*.xlsx")],
@@ -3326,95 +4273,56 @@ class CaseLogApp:
             logging.info("XLSX import cancelled by user.")
             return
 
-        try:
-            self.update_status("Importing cases from XLSX...")
-            self.progress.grid()  # Show progress bar using grid
-            self.progress.start(10)  # Start progress animation
-            
-            # Read the Excel file
-            df = pd.read_excel(file_path, engine='openpyxl')
-            excel_columns = [str(col).strip() for col in df.columns]
-            
-            # Build mapping from Excel headers to DB keys
-            excel_header_to_db_key = {}
-            for col_key, config in self.tree_columns_config.items():
-                if col_key in ['id', 'created_at']:  # Skip these columns
-                    continue
-                display_text = config.get("text", col_key)
-                for excel_col in excel_columns:
-                    if excel_col.strip().lower() in [display_text.strip().lower(), col_key.strip().lower()]:
-                        excel_header_to_db_key[excel_col] = col_key
-                        break
-
-            imported_count = 0
-            skipped_count = 0
-
-            # Process each row
-            for idx, row in df.iterrows():
-                case_data = {}
-                for excel_col, db_key in excel_header_to_db_key.items():
-                    value = row.get(excel_col)
-                    
-                    # Handle dates
-                    if db_key in ['start_date', 'end_date'] and pd.notnull(value):
-                        try:
-                            value = pd.to_datetime(value).strftime('%Y-%m-%d')
-                        except:
-                            value = None
-                
-                    # Convert boolean fields
-                    elif db_key == 'fpr_complete':
-                        if isinstance(value, bool):
-                            value = 1 if value else 0
-                        elif pd.notnull(value):
-                            value = 1 if str(value).lower() in ['yes', 'true', '1'] else 0
-                        else:
-                            value = 0
-                
-                    # Handle data_recovered field
-                    elif db_key == 'data_recovered':
-                        if isinstance(value, bool):
-                            value = "Yes" if value else "No"
-                        elif pd.notnull(value):
-                            value = "Yes" if str(value).lower() in ['yes', 'true', '1'] else "No"
-                        else:
-                            value = ""
-                
-                    # Handle all other fields
-                    case_data[db_key] = value if pd.notnull(value) else None
-
-                # Try to add the case
-                if add_case_db(case_data):
-                    imported_count += 1
-                    self.update_status(f"Imported {imported_count} cases...")
-                else:
-                    skipped_count += 1
-                    logging.warning(f"Row {idx+1} failed to add: {case_data}")
-
-            # Refresh UI after import
-            self.refresh_data_view()
-            # self.create_dashboard_widgets()  # Removed: dashboard no longer exists
-            if hasattr(self, 'map_widget'):
-                self.load_map_markers()
-            self.populate_graph_filters()
-
-            # Show results
-            Messagebox.show_info(
-                "Import Complete",
-                f"Import finished.\nImported: {imported_count}\nSkipped: {skipped_count}"
-            )
+        self.update_status("Importing cases from XLSX...")
+        self.progress.grid()  # Show progress bar using grid
+        self.progress.start(10)  # Start progress animation
 
-        except Exception as e:
-            logging.error(f"Error importing cases from XLSX: {e}")
-            Messagebox.show_error(
-                "Import Error",
-                f"Failed to import cases: {e}"
-            )
-        finally:
+        def done(imported_count, skipped_count, error=None):
+            # Back on the Tk thread once the worker has finished
             self.progress.stop()  # Stop progress animation
             self.progress.grid_remove()  # Hide progress bar
+            if error is None:
+                # Refresh UI after import
+                self._schedule_full_refresh()
+                # Show results
+                Messagebox.show_info(
+                    "Import Complete",
+                    f"Import finished.\nImported: {imported_count}\nSkipped: {skipped_count}"
+                )
+            else:
+                Messagebox.show_error(
+                    "Import Error",
+                    f"Failed to import cases: {error}"
+                )
             self.update_status(f"Import complete. {imported_count} imported, {skipped_count} skipped.")
 
+        def worker():
+            # Reads and inserts off the Tk thread so the window (and progress bar) stay live
+            imported_count = 0
+            skipped_count = 0
+            try:
+                # Read the Excel file; large workbooks arrive in chunks that are inserted as they are read
+                excel_header_to_db_key = None
+                for df in iter_excel_frames(file_path):
+                    if excel_header_to_db_key is None:
+                        excel_header_to_db_key = self._import_header_map(df.columns)
+                    cases_to_import = convert_import_frame(df, excel_header_to_db_key)
+
+                    # Insert each batch in a single transaction
+                    self.root.after(0, self.update_status, f"Saving {imported_count + len(cases_to_import)} cases...")
+                    inserted = add_cases_db(cases_to_import)
+                    imported_count += inserted
+                    if not inserted and cases_to_import:
+                        skipped_count += len(cases_to_import)
+                        logging.warning(f"Failed to add {len(cases_to_import)} imported rows; batch rolled back.")
+            except Exception as e:
+                logging.error(f"Error importing cases from XLSX: {e}")
+                self.root.after(0, done, imported_count, skipped_count, e)
+                return
+            self.root.after(0, done, imported_count, skipped_count)
+
+        threading.Thread(target=worker, name="xlsx-import", daemon=True).start()
+
     def show_application_log(self):
         """Shows the application log file in a scrollable window."""
         try:
@@ -3433,12 +4341,10 @@ class CaseLogApp:
             )
             log_text.pack(fill='both', expand=True, padx=10, pady=10)
 
-            # Read and display the log file
+            # Read and display the end of the log file
             try:
-                with open(LOG_FILENAME, 'r', encoding='utf-8') as f:
-                    log_content = f.read()
-                    log_text.insert('1.0', log_content)
-                    log_text.config(state='disabled')  # Make read-only
+                log_text.insert('1.0', read_log_tail(LOG_FILENAME))
+                log_text.config(state='disabled')  # Make read-only
             except Exception as e:
                 log_text.insert('1.0', f"Error reading log file: {e}")
                 log_text.config(state='disabled')
@@ -3451,9 +4357,7 @@ class CaseLogApp:
                 try:
                     log_text.config(state='normal')
                     log_text.delete('1.0', tk.END)
-                    with open(LOG_FILENAME, 'r', encoding='utf-8') as f:
-                        log_content = f.read()
-                        log_text.insert('1.0', log_content)
+                    log_text.insert('1.0', read_log_tail(LOG_FILENAME))
                     log_text.config(state='disabled')
                 except Exception as e:
                     log_text.config(state='normal')
@@ -3573,56 +4477,46 @@ class CaseLogApp:
             return
 
         try:
-            # Clear the database
-            conn = sqlite3.connect(DB_FILENAME)
-            cursor = conn.cursor()
-            
-            # Drop and recreate case_log table
-            cursor.execute("DROP TABLE IF EXISTS case_log")
-            cursor.execute('''
-                CREATE TABLE case_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    case_number TEXT,
-                    examiner TEXT,
-                    offense_type TEXT,
-                    device_type TEXT,
-                    start_date TEXT,
-                    end_date TEXT,
-                    volume_size_gb REAL,
-                    city_of_offense TEXT,
-                    state_of_offense TEXT,
-                    investigator TEXT,
-                    agency TEXT,
-                    model TEXT,
-                    os TEXT,
-                    data_recovered TEXT,
-                    fpr_complete INTEGER,
-                    notes TEXT,
-                    created_at TEXT
-                )
-            ''')
+            # Clear the database (the shared connection stays open)
+            with _LOCK:
+                conn = _get_conn()
+                with conn:
+                    cursor = conn.cursor()
+                    # DDL would otherwise run in autocommit; open the transaction explicitly so the
+                    # trigger drops below roll back with everything else if a later statement fails
+                    cursor.execute("BEGIN")
             
-            # Clear geocache table
-            cursor.execute("DELETE FROM geocache")
+                    # Empty case_log in place so its schema and indexes are kept. The full-text
+                    # sync triggers are dropped first so they don't run once per deleted row; the
+                    # index is emptied in one step and the triggers are recreated afterwards.
+                    for trigger in ("case_log_ai", "case_log_ad", "case_log_au"):
+                        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                    cursor.execute("DELETE FROM case_log")
+                    cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'case_log'") # Restart ids at 1
+                    if _FTS_AVAILABLE:
+                        cursor.execute("INSERT INTO case_log_fts(case_log_fts) VALUES ('delete-all')")
+                    _create_case_log_fts(cursor)
+
+                    # Clear geocache table
+                    cursor.execute("DELETE FROM geocache")
             
-            # Clear combo values from settings (except password)
-            cursor.execute("DELETE FROM settings WHERE key LIKE 'combo_%'")
-            
-            conn.commit()
-            conn.close()
+                    # Clear combo values from settings (except password)
+                    cursor.execute("DELETE FROM settings WHERE key LIKE 'combo_%'")
+                invalidate_cases_cache()
+                invalidate_combo_values_cache()
+                invalidate_geocache_mem()
+                # Give the freed pages back to the filesystem (must run outside a transaction)
+                conn.execute("VACUUM")
 
             # Clear any saved images
             if os.path.exists(LOGO_FILENAME):
                 os.remove(LOGO_FILENAME)
+            invalidate_logo_reader()
             if os.path.exists(MARKER_ICON_FILENAME):
                 os.remove(MARKER_ICON_FILENAME)
 
             # Reload UI elements
-            self.refresh_data_view()
-            # self.create_dashboard_widgets()  # Removed: dashboard no longer exists
-            if hasattr(self, 'map_widget'):
-                self.load_map_markers()
-            self.populate_graph_filters()
+            self._schedule_full_refresh()
             self.load_logo_image()
             self.load_marker_icon_image()
 
@@ -3652,6 +4546,11 @@ class CaseLogApp:
             text (str): Text to display in status bar
             duration (int, optional): Time in ms after which to clear the status
         """
+        # Nothing to do if the same text is already showing with no auto-clear pending or requested
+        if (text == getattr(self, 'status_text', None) and not duration
+                and not getattr(self, 'status_animation_id', None)):
+            return
+
         # Cancel any pending status clear
         if hasattr(self, 'status_animation_id') and self.status_animation_id:
             self.root.after_cancel(self.status_animation_id)
@@ -3668,23 +4567,31 @@ class CaseLogApp:
         if duration:
             self.status_animation_id = self.root.after(duration, lambda: self.update_status(""))
         
+    def _schedule_full_refresh(self):
+        """Refreshes the View Data rows, map markers and graphs once the current callback returns.
+        Call after changing case data; changes made back to back share a single refresh."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._do_full_refresh)
+
+    def _do_full_refresh(self):
+        self._refresh_pending = False
+        self.refresh_data_view() # Count and first page load in the background
+        self.load_map_markers() # Threaded; skipped when the map isn't built or nothing changed
+        self.populate_graph_filters() # Redraws now only if the Graphs tab is showing
+
     def populate_graph_filters(self):
-        """Populates the graph filters (year dropdown) with available years from the data."""
+        """Populates the graph filters (year dropdown) with available years from the data.
+        While the Graphs tab is hidden this only marks the graph stale; it is redrawn when shown."""
+        if not self._graph_initialized:
+            return # Filled in when the tab is first opened
+        if self.notebook.select() != str(self.graph_frame):
+            self._graph_stale = True
+            return
+        self._graph_stale = False
         try:
-            # Get all cases
-            cases = get_all_cases_db()
-            
-            # Extract unique years from start_date
-            years = set()
-            for case in cases:
-                start_date = case.get('start_date', '')
-                if start_date and len(start_date) >= 4:  # Ensure we have at least YYYY
-                    year = start_date[:4]
-                    if year.isdigit():  # Ensure it's a valid year
-                        years.add(year)
-            
-            # Sort years in descending order
-            sorted_years = sorted(years, reverse=True)
+            # Unique valid years from start_date, newest first (read through idx_start_year)
+            sorted_years = get_start_years_db()
             
             # Update combobox values
             if hasattr(self, 'graph_year_combo'):
@@ -3704,12 +4611,16 @@ class CaseLogApp:
     def apply_view_filter(self):
         """Apply the search/filter to the data view."""
         filter_str = self.view_search_var.get().strip().lower()
+        if filter_str == self._view_filter_string:
+            return # Same filter (e.g. Enter pressed again); the rows shown are already current
         self._view_filter_string = filter_str
         self.refresh_data_view()
 
     def clear_view_filter(self):
         """Clear the search/filter and show all data."""
         self.view_search_var.set("")
+        if not self._view_filter_string:
+            return # Already showing all data
         self._view_filter_string = ""
         self.refresh_data_view()
 
@@ -3717,6 +4628,17 @@ class CaseLogApp:
     def on_closing(self):
         """Handle cleanup when closing the application."""
         try:
+            # Stop geocoding workers and cancel queued requests so exit does not wait for them
+            self._shutdown.set()
+            for future in self._geocode_futures:
+                future.cancel()
+            for after_id in self._debounce_ids.values():
+                self.root.after_cancel(after_id)
+            self._debounce_ids.clear()
+            self._image_pool.shutdown(wait=False, cancel_futures=True)
+            # Keep locations geocoded since the last poll so the next start does not request them again
+            self._drain_geocoded_results()
+
             # Clear references to PhotoImage objects to prevent deletion errors
             if hasattr(self, 'logo_image_tk'):
                 self.logo_image_tk = None